@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for serial and partitioned validate_dataset runs, quality history
+and quality alerts
+"""
+
+import unittest
+from unittest import mock
+import pandas as pd
+import sys
+import os
+import logging
+import gc
+import weakref
+
+# Add the project root to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+from utils import data_quality
+from utils.data_quality import DataQualityMonitor, validate_dataset, _validate_partition
+from utils.monitoring import MetricsRegistry
+
+def _record_issues(results):
+    """Record-level issues in a stable order"""
+    return sorted(repr(issue) for issue in results["issues"] if "record_index" in issue)
+
+class TestValidateDataset(unittest.TestCase):
+    """Test cases for validate_dataset"""
+    
+    def setUp(self):
+        """Set up a dataset whose last record duplicates one in the first partition"""
+        self.data = pd.DataFrame({
+            'business_name': [f'Business {i}' if i % 7 else None for i in range(40)] + ['Business 1'],
+            'email': [f'contact{i}@example{i}.com' if i % 5 else f'invalid{i}' for i in range(40)]
+                     + ['contact1@example1.com'],
+            'phone': [f'+56 9 {1000 + i} {2000 + i}' for i in range(40)] + ['+56 9 1001 2001']
+        })
+    
+    def _validate(self, workers):
+        """Validate the dataset, partitioning it whenever workers > 1"""
+        registry = MetricsRegistry()
+        with mock.patch.object(data_quality, "_PARALLEL_MIN_RECORDS", 0):
+            results = validate_dataset(self.data, registry, "test", workers=workers)
+        return results, registry
+    
+    def test_rejects_workers_below_one(self):
+        """workers=0 or negative raises instead of using every CPU"""
+        for workers in (0, -2):
+            with self.assertRaises(ValueError):
+                validate_dataset(self.data, MetricsRegistry(), workers=workers)
+    
+    def test_parallel_matches_serial(self):
+        """Partitioned validation gives the same results and metrics as serial"""
+        serial, serial_registry = self._validate(workers=1)
+        parallel, parallel_registry = self._validate(workers=2)
+        
+        self.assertEqual(_record_issues(serial), _record_issues(parallel))
+        self.assertEqual(len(serial["issues"]), len(parallel["issues"]))
+        for key in ("records_processed", "records_with_issues", "issue_types", "field_issues"):
+            self.assertEqual(serial[key], parallel[key])
+        self.assertEqual(serial["quality_score"], parallel["quality_score"])
+        
+        serial_gauges = serial_registry.get_metrics()["gauges"]
+        parallel_gauges = parallel_registry.get_metrics()["gauges"]
+        for gauge in ("data_quality.records_processed", "data_quality.records_with_issues", "data_quality.score"):
+            self.assertEqual(serial_gauges[gauge], parallel_gauges[gauge])
+    
+    def test_duplicates_across_partitions(self):
+        """A duplicate of a record in another partition is reported"""
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                results, _ = self._validate(workers)
+                duplicates = [
+                    issue["record_index"] for issue in results["issues"]
+                    if issue["type"] == "duplicate_record" and "record_index" in issue
+                ]
+                self.assertEqual(duplicates, [40])
+    
+    def test_absorbed_results_update_monitor_like_process_dataset(self):
+        """Merged partition results update statistics and history like a serial run"""
+        serial_monitor = DataQualityMonitor(MetricsRegistry())
+        serial_results = serial_monitor.process_dataset(self.data, "test")
+        
+        merged_monitor = DataQualityMonitor(MetricsRegistry())
+        partials = [
+            _validate_partition(part, merged_monitor.config)
+            for part in (self.data.iloc[:20], self.data.iloc[20:])
+        ]
+        merged_monitor._absorb_results(
+            merged_monitor._merge_partition_results(self.data, partials, "test"), "test"
+        )
+        
+        for key in ("total_records_processed", "records_with_issues", "issue_types", "fields_with_issues"):
+            self.assertEqual(serial_monitor.statistics[key], merged_monitor.statistics[key])
+        
+        serial_history = serial_monitor.quality_history["test"]
+        merged_history = merged_monitor.quality_history["test"]
+        self.assertEqual(len(serial_history), 1)
+        self.assertEqual(len(merged_history), 1)
+        for key in ("quality_score", "records_processed", "records_with_issues"):
+            self.assertEqual(serial_history[0][key], merged_history[0][key])
+        self.assertEqual(merged_monitor._score_history["test"][-1], serial_results["quality_score"])
+
+class TestQualityHistory(unittest.TestCase):
+    """Test cases for the quality score history"""
+    
+    def test_trend_uses_last_entries(self):
+        """The trend spans the newest _MAX_HISTORY_ENTRIES scores"""
+        monitor = DataQualityMonitor(MetricsRegistry())
+        self.assertIsNone(monitor._history_trend("test"))
+        for score in range(data_quality._MAX_HISTORY_ENTRIES + 50):
+            monitor._record_history({
+                "timestamp": "2024-01-01T00:00:00",
+                "quality_score": float(score),
+                "records_processed": 1,
+                "records_with_issues": 0
+            }, "test")
+        self.assertEqual(len(monitor.quality_history["test"]), data_quality._MAX_HISTORY_ENTRIES)
+        self.assertEqual(monitor._history_trend("test"), data_quality._MAX_HISTORY_ENTRIES - 1)
+
+class TestQualityAlerts(unittest.TestCase):
+    """Test cases for background quality alert delivery"""
+    
+    def _alert(self, monitor):
+        """Queue one alert on the monitor"""
+        results = {
+            "quality_score": 40.0,
+            "records_processed": 10,
+            "records_with_issues": 6,
+            "issue_types": {"invalid_format": 6}
+        }
+        monitor._send_quality_alert(results, "test")
+    
+    def test_close_delivers_queued_alerts(self):
+        """close() waits for queued alerts to be sent"""
+        notification_manager = mock.Mock()
+        monitor = DataQualityMonitor(MetricsRegistry(), notification_manager=notification_manager)
+        self._alert(monitor)
+        monitor.close()
+        notification_manager.send_notification.assert_called_once()
+        self.assertIn("Field format is invalid: 6 occurrences", notification_manager.send_notification.call_args.kwargs["message"])
+    
+    def test_unclosed_monitor_is_collected_after_delivering(self):
+        """The worker does not keep the monitor alive, and collecting it drains the queue"""
+        notification_manager = mock.Mock()
+        monitor = DataQualityMonitor(MetricsRegistry(), notification_manager=notification_manager)
+        self._alert(monitor)
+        alert_thread = monitor._alert_thread
+        ref = weakref.ref(monitor)
+        del monitor
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertFalse(alert_thread.is_alive())
+        notification_manager.send_notification.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
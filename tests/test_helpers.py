@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for utils.helpers
+"""
+
+import unittest
+import sys
+import os
+import logging
+import threading
+import time
+from unittest import mock
+
+# Add the project root to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+from utils import helpers
+from utils.helpers import extract_domain, extract_emails, rate_limit_for, safe_request_many
+
+class TestExtractDomain(unittest.TestCase):
+    """Test cases for extract_domain"""
+    
+    def test_bare_hosts(self):
+        """Bare hostnames are returned without the www. prefix"""
+        self.assertEqual(extract_domain('www.example.com'), 'example.com')
+        self.assertEqual(extract_domain('paginasamarillas.cl'), 'paginasamarillas.cl')
+        self.assertEqual(extract_domain('localhost'), 'localhost')
+    
+    def test_urls(self):
+        """Full URLs are reduced to their network location"""
+        self.assertEqual(extract_domain('https://www.example.com/contact?x=1'), 'example.com')
+        self.assertEqual(extract_domain('http://maps.google.com:8080/'), 'maps.google.com:8080')
+    
+    def test_relative_paths_have_no_domain(self):
+        """Relative hrefs are not mistaken for hosts"""
+        for href in (
+            'contact', 'index', 'about/us', './about', '../index', '?page=2', '#top',
+            'contact.html', 'index.php', 'style.css', 'logo.PNG'
+        ):
+            with self.subTest(href=href):
+                self.assertEqual(extract_domain(href), '')
+    
+    def test_malformed_hosts_have_no_domain(self):
+        """Empty labels disqualify the bare-host fast path"""
+        for value in ('a..b', '.com', 'com.'):
+            with self.subTest(value=value):
+                self.assertEqual(extract_domain(value), '')
+    
+    def test_empty_input(self):
+        """Empty input returns None"""
+        self.assertIsNone(extract_domain(''))
+
+class TestExtractEmails(unittest.TestCase):
+    """Test cases for extract_emails"""
+    
+    def test_separated_addresses(self):
+        """Addresses separated by non-address characters are all extracted"""
+        self.assertEqual(
+            extract_emails("Write to sales@shop.cl, or INFO@shop.cl / info@shop.cl"),
+            ["sales@shop.cl", "INFO@shop.cl"]
+        )
+    
+    def test_address_glued_to_previous_match(self):
+        """An address continuing the run of a previous match is not extracted"""
+        self.assertEqual(extract_emails("a@b.com.x@c.com"), ["a@b.com"])
+    
+    def test_long_run_without_at_is_linear(self):
+        """A long run of address characters is scanned in linear time"""
+        start = time.perf_counter()
+        self.assertEqual(extract_emails("a" * 50_000 + " @"), [])
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+class _FakeClock:
+    """Monotonic clock that only advances when sleeping"""
+    
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+    
+    def monotonic(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+class TestRateLimitFor(unittest.TestCase):
+    """Test cases for the per-domain token bucket"""
+    
+    def setUp(self):
+        """Start every test with empty buckets and a fake clock"""
+        helpers._rate_buckets.clear()
+        self.clock = _FakeClock()
+        patcher = mock.patch.object(helpers, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(helpers._rate_buckets.clear)
+    
+    def test_burst_then_steady_rate(self):
+        """The first burst requests pass at once, later ones are spaced 1/rps apart"""
+        for _ in range(5):
+            rate_limit_for("example.com", rps=2, burst=3)
+        self.assertEqual(len(self.clock.sleeps), 2)
+        for wait in self.clock.sleeps:
+            self.assertAlmostEqual(wait, 0.5)
+    
+    def test_elapsed_time_counts_towards_wait(self):
+        """Time spent between requests shortens the next wait"""
+        rate_limit_for("example.com", rps=1)
+        self.clock.now += 0.75
+        rate_limit_for("example.com", rps=1)
+        self.assertEqual(len(self.clock.sleeps), 1)
+        self.assertAlmostEqual(self.clock.sleeps[0], 0.25)
+    
+    def test_idle_refill_is_capped_at_burst(self):
+        """A long idle period does not bank more than burst tokens"""
+        rate_limit_for("example.com", rps=10, burst=2)
+        self.clock.now += 60
+        for _ in range(3):
+            rate_limit_for("example.com", rps=10, burst=2)
+        self.assertEqual(len(self.clock.sleeps), 1)
+        self.assertAlmostEqual(self.clock.sleeps[0], 0.1)
+    
+    def test_domains_are_independent(self):
+        """Requests to one domain do not consume another domain's budget"""
+        rate_limit_for("a.example.com", rps=1)
+        rate_limit_for("b.example.com", rps=1)
+        self.assertEqual(self.clock.sleeps, [])
+    
+    def test_invalid_rate(self):
+        """Non-positive rates are rejected"""
+        with self.assertRaises(ValueError):
+            rate_limit_for("example.com", rps=0)
+
+class TestRateLimitForThreads(unittest.TestCase):
+    """Test cases for the token bucket shared between threads"""
+    
+    def setUp(self):
+        """Start with empty buckets"""
+        helpers._rate_buckets.clear()
+        self.addCleanup(helpers._rate_buckets.clear)
+    
+    def test_concurrent_workers_share_the_rate(self):
+        """Threads together stay at the target rate"""
+        finished = []
+        lock = threading.Lock()
+        
+        def worker():
+            rate_limit_for("example.com", rps=20)
+            with lock:
+                finished.append(time.monotonic())
+        
+        start = time.monotonic()
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        
+        # One token is available immediately, the other five wait 50 ms each
+        self.assertEqual(len(finished), 6)
+        self.assertGreaterEqual(max(finished) - start, 0.24)
+
+class _FakeSession:
+    """Session whose responses depend on the requested URL"""
+    
+    def request(self, method, url, **kwargs):
+        delay, _, outcome = url.rpartition('/')[2].partition('-')
+        time.sleep(float(delay))
+        if outcome == "timeout":
+            raise helpers.requests.exceptions.Timeout(url)
+        response = mock.Mock(content=b"<html></html>", url=url)
+        if outcome == "404":
+            response.raise_for_status.side_effect = helpers.requests.exceptions.HTTPError(url)
+        return response
+
+class TestSafeRequestMany(unittest.TestCase):
+    """Test cases for concurrent safe requests"""
+    
+    def setUp(self):
+        """Route requests through a fake session"""
+        patcher = mock.patch.object(helpers, "_get_session", return_value=_FakeSession())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_results_follow_input_order(self):
+        """Responses are returned in the order of urls, not of completion"""
+        urls = [f"https://example.com/{delay}-ok" for delay in ("0.15", "0.1", "0.05", "0")]
+        responses = safe_request_many(urls)
+        self.assertEqual([response.url for response in responses], urls)
+    
+    def test_failed_requests_become_none(self):
+        """Request errors yield None in their slot without affecting the others"""
+        urls = [
+            "https://example.com/0.05-ok",
+            "https://example.com/0-timeout",
+            "https://example.com/0-404",
+            "https://example.com/0-ok"
+        ]
+        responses = safe_request_many(urls, max_workers=2)
+        self.assertEqual(responses[0].url, urls[0])
+        self.assertIsNone(responses[1])
+        self.assertIsNone(responses[2])
+        self.assertEqual(responses[3].url, urls[3])
+    
+    def test_unexpected_errors_propagate(self):
+        """Errors safe_request does not handle are raised to the caller"""
+        with mock.patch.object(helpers, "safe_request", side_effect=[None, ValueError("bad"), None]):
+            with self.assertRaises(ValueError):
+                safe_request_many(["a", "b", "c"], max_workers=1)
+    
+    def test_kwargs_are_forwarded(self):
+        """Extra arguments reach every safe_request call"""
+        with mock.patch.object(helpers, "safe_request", return_value=None) as safe_request:
+            safe_request_many(["a", "b"], timeout=5)
+        safe_request.assert_has_calls([mock.call("a", timeout=5), mock.call("b", timeout=5)], any_order=True)
+    
+    def test_empty_input(self):
+        """No URLs means no requests"""
+        self.assertEqual(safe_request_many([]), [])
+
+class _FakeDriver:
+    """Driver whose DOM mutation flag flips after a few polls"""
+    
+    current_url = "https://example.com/search?page=1"
+    
+    def __init__(self, polls_until_change):
+        self.polls_until_change = polls_until_change
+        self.scripts = []
+    
+    def execute_script(self, script):
+        self.scripts.append(script)
+        if script == helpers._PAGE_CHANGE_OBSERVER_JS:
+            return None
+        self.polls_until_change -= 1
+        return self.polls_until_change <= 0
+
+class TestWaitForPageChange(unittest.TestCase):
+    """Test cases for wait_for_page_change"""
+    
+    def setUp(self):
+        """Skip the settle delay"""
+        patcher = mock.patch.object(helpers.time, "sleep")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_in_place_change_with_reference_element(self):
+        """DOM mutations are detected even when a live reference element is given"""
+        driver = _FakeDriver(polls_until_change=2)
+        body = mock.Mock()
+        body.is_enabled.return_value = True
+        self.assertTrue(helpers.wait_for_page_change(driver, timeout=5, reference_element=body))
+        self.assertEqual(driver.scripts[0], helpers._PAGE_CHANGE_OBSERVER_JS)
+    
+    def test_no_change_times_out(self):
+        """Without URL, staleness or DOM changes the wait reports no change"""
+        driver = _FakeDriver(polls_until_change=float("inf"))
+        self.assertFalse(helpers.wait_for_page_change(driver, timeout=0.3))
+
+if __name__ == '__main__':
+    unittest.main()
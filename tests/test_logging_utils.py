@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the JSON formatting, sensitive data masking and the buffered and
+queue-backed logging in utils.logging_utils
+"""
+
+import unittest
+import tempfile
+import shutil
+import time
+import sys
+import os
+import json
+import logging
+from unittest import mock
+
+# Add the project root to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import logging_utils
+from utils.logging_utils import (
+    BufferedFileHandler, BufferedRotatingFileHandler, JsonFormatter, SensitiveDataFilter,
+    setup_advanced_logger, _stop_queue_listener
+)
+
+def _make_record(msg, level=logging.INFO):
+    """Build a log record without going through a logger"""
+    return logging.LogRecord("test", level, __file__, 0, msg, None, None)
+
+class TestJsonFormatter(unittest.TestCase):
+    """Test cases for JsonFormatter"""
+    
+    def test_non_str_keys(self):
+        """Extras with non-string dict keys are written the same by both serializers"""
+        record = _make_record("status counts")
+        record.counts = {200: 5, 404: 1}
+        outputs = []
+        for orjson_available in sorted({False, logging_utils.ORJSON_AVAILABLE}):
+            with self.subTest(orjson=orjson_available):
+                with mock.patch.object(logging_utils, "ORJSON_AVAILABLE", orjson_available):
+                    output = json.loads(JsonFormatter().format(record))
+                self.assertEqual(output["counts"], {"200": 5, "404": 1})
+                outputs.append(output)
+        self.assertTrue(all(output == outputs[0] for output in outputs))
+
+class TestSensitiveDataFilter(unittest.TestCase):
+    """Test cases for SensitiveDataFilter"""
+    
+    def test_only_short_messages_cached(self):
+        """Long messages are masked without being kept in the cache"""
+        sensitive_filter = SensitiveDataFilter()
+        short = "contact john.doe@example.com"
+        long = "<div>" * 100 + " john.doe@example.com"
+        for message in (short, long):
+            record = _make_record(message)
+            sensitive_filter.filter(record)
+            self.assertNotIn("john.doe@example.com", record.msg)
+        self.assertEqual(sensitive_filter._mask_cached.cache_info().currsize, 1)
+
+class TestBufferedRotatingFileHandler(unittest.TestCase):
+    """Test cases for BufferedRotatingFileHandler"""
+    
+    def setUp(self):
+        """Create a temporary log directory"""
+        self.log_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.log_dir, "test.log")
+    
+    def tearDown(self):
+        """Remove the temporary log directory"""
+        shutil.rmtree(self.log_dir)
+    
+    def _handler(self, **kwargs):
+        """Create a handler that never flushes on the interval during a test"""
+        handler = BufferedRotatingFileHandler(self.log_file, encoding="utf-8", **kwargs)
+        handler.flush_interval = 3600
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self.addCleanup(handler.close)
+        return handler
+    
+    def test_info_records_stay_buffered(self):
+        """INFO records are not written to disk until a warning or close"""
+        handler = self._handler(maxBytes=10_485_760, backupCount=1)
+        for i in range(51):
+            handler.emit(_make_record(f"info record {i}"))
+        self.assertEqual(os.path.getsize(self.log_file), 0)
+        
+        handler.emit(_make_record("warning record", logging.WARNING))
+        with open(self.log_file, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 52)
+        self.assertEqual(lines[-1], "warning record")
+    
+    def test_close_flushes_buffer(self):
+        """Buffered records reach the file on close"""
+        handler = self._handler(maxBytes=10_485_760, backupCount=1)
+        for i in range(10):
+            handler.emit(_make_record(f"info record {i}"))
+        handler.close()
+        with open(self.log_file, encoding="utf-8") as f:
+            self.assertEqual(len(f.read().splitlines()), 10)
+    
+    def test_rollover_counts_encoded_bytes(self):
+        """The size limit applies to encoded bytes, not characters"""
+        handler = self._handler(maxBytes=50, backupCount=1)
+        # 40 bytes in UTF-8 but only 20 characters
+        handler.emit(_make_record("ñ" * 20))
+        handler.emit(_make_record("ñ" * 20))
+        handler.close()
+        self.assertTrue(os.path.exists(self.log_file + ".1"))
+        self.assertEqual(os.path.getsize(self.log_file), 41)
+    
+    def test_counter_starts_from_existing_file(self):
+        """Appending to an existing file counts its current size"""
+        with open(self.log_file, "w", encoding="utf-8") as f:
+            f.write("x" * 45 + "\n")
+        handler = self._handler(maxBytes=50, backupCount=1)
+        handler.emit(_make_record("hello"))
+        handler.close()
+        self.assertTrue(os.path.exists(self.log_file + ".1"))
+        with open(self.log_file, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "hello\n")
+
+class TestBufferedFileHandler(unittest.TestCase):
+    """Test cases for the BufferedFileHandler flush timer"""
+    
+    def setUp(self):
+        """Create a temporary log file handler"""
+        self.log_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.log_dir, "test.log")
+        self.handler = BufferedFileHandler(self.log_file, encoding="utf-8")
+        self.handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    def tearDown(self):
+        """Close the handler and remove the temporary directory"""
+        self.handler.close()
+        shutil.rmtree(self.log_dir)
+    
+    def _wait_for_size(self, size, timeout=2.0):
+        """Wait until the log file reaches a size, returning the last size seen"""
+        deadline = time.monotonic() + timeout
+        while os.path.getsize(self.log_file) < size and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return os.path.getsize(self.log_file)
+    
+    def test_idle_records_flushed_by_timer(self):
+        """Records reach the disk after the interval without further logging"""
+        for i in range(51):
+            self.handler.emit(_make_record(f"info record {i:02d}"))
+        self.assertEqual(os.path.getsize(self.log_file), 0)
+        
+        expected = 51 * len("info record 00\n")
+        self.assertEqual(self._wait_for_size(expected), expected)
+    
+    def test_timer_restarts_after_flush(self):
+        """A record logged after a timed flush gets its own flush"""
+        self.handler.emit(_make_record("first"))
+        self.assertEqual(self._wait_for_size(6), 6)
+        
+        self.handler.emit(_make_record("second"))
+        self.assertEqual(self._wait_for_size(13), 13)
+    
+    def test_close_cancels_timer(self):
+        """Closing flushes the buffer and stops the pending timer"""
+        self.handler.flush_interval = 3600
+        self.handler.emit(_make_record("pending"))
+        timer = self.handler._flush_timer
+        self.handler.close()
+        timer.join(1)
+        self.assertFalse(timer.is_alive())
+        self.assertEqual(os.path.getsize(self.log_file), len("pending\n"))
+
+class TestQueueLogger(unittest.TestCase):
+    """Test cases for loggers writing through a queue listener"""
+    
+    def setUp(self):
+        """Create a temporary log directory"""
+        self.log_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.log_dir, "queued.log")
+        # Other test modules disable logging when imported
+        self.addCleanup(logging.disable, logging.root.manager.disable)
+        logging.disable(logging.NOTSET)
+    
+    def tearDown(self):
+        """Remove the temporary log directory"""
+        shutil.rmtree(self.log_dir)
+    
+    def _logger(self, name, **kwargs):
+        """Set up a queue-backed file logger and stop it after the test"""
+        logger = setup_advanced_logger(
+            name, log_file=self.log_file, console=False, use_queue=True, **kwargs
+        )
+        handlers = logger._queue_listener.handlers
+        self.addCleanup(lambda: [handler.close() for handler in handlers])
+        self.addCleanup(_stop_queue_listener, logger)
+        return logger
+    
+    def _lines(self):
+        """Read the log file"""
+        with open(self.log_file, encoding="utf-8") as f:
+            return f.read().splitlines()
+    
+    def test_records_written_after_listener_stop(self):
+        """Every queued record is on disk once the listener is stopped"""
+        for rotate_logs in (True, False):
+            with self.subTest(rotate_logs=rotate_logs):
+                logger = self._logger(f"queued_{rotate_logs}", rotate_logs=rotate_logs)
+                for i in range(200):
+                    logger.info("record %d", i)
+                _stop_queue_listener(logger)
+                lines = self._lines()
+                self.assertEqual(len(lines), 200)
+                self.assertTrue(lines[-1].endswith("record 199"))
+                os.remove(self.log_file)
+    
+    def test_arguments_merged_when_queued(self):
+        """Mutable arguments are rendered as they were at the logging call"""
+        logger = self._logger("queued_args")
+        items = ["first"]
+        logger.info("items: %s", items)
+        items.append("second")
+        _stop_queue_listener(logger)
+        self.assertTrue(self._lines()[0].endswith("items: ['first']"))
+    
+    def test_queue_is_opt_in(self):
+        """Loggers write through their own handlers unless a queue is requested"""
+        logger = setup_advanced_logger("direct", log_file=self.log_file, console=False)
+        self.addCleanup(lambda: [handler.close() for handler in logger.handlers])
+        self.assertIsNone(getattr(logger, "_queue_listener", None))
+        self.assertFalse(any(
+            isinstance(handler, logging.handlers.QueueHandler) for handler in logger.handlers
+        ))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for utils.monitoring
+"""
+
+import unittest
+import random
+import math
+import sys
+import os
+import logging
+import threading
+import time
+import gzip
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Add the project root to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+from utils import monitoring
+from utils.monitoring import MetricsRegistry
+
+def _exact_stats(values):
+    """Histogram stats as computed from the sorted raw samples"""
+    values = sorted(values)
+    length = len(values)
+    return {
+        "count": length,
+        "sum": sum(values),
+        "min": values[0],
+        "max": values[-1],
+        "avg": sum(values) / length,
+        "median": values[length // 2] if length % 2 else (values[length // 2 - 1] + values[length // 2]) / 2,
+        "p95": values[int(length * 0.95)] if length > 20 else values[-1],
+        "p99": values[int(length * 0.99)] if length > 100 else values[-1]
+    }
+
+class TestHistograms(unittest.TestCase):
+    """Test cases for MetricsRegistry histograms"""
+    
+    def setUp(self):
+        """Create a registry"""
+        self.registry = MetricsRegistry()
+    
+    def test_percentiles_match_exact_computation(self):
+        """Bucketed percentiles stay within one bucket of the exact values"""
+        rng = random.Random(42)
+        samples = {
+            "uniform": [rng.uniform(0, 10) for _ in range(5000)],
+            "latency": [rng.lognormvariate(-2, 1) for _ in range(2000)],
+            "small": [rng.uniform(1, 2) for _ in range(21)],
+            "items_found": [rng.randint(0, 50) for _ in range(300)],
+            "single": [7.5]
+        }
+        for name, values in samples.items():
+            for value in values:
+                self.registry.record_histogram(name, value)
+        
+        histograms = self.registry.get_metrics()["histograms"]
+        for name, values in samples.items():
+            expected = _exact_stats(values)
+            actual = histograms[name]
+            with self.subTest(histogram=name):
+                self.assertEqual(actual["count"], expected["count"])
+                for field in ("sum", "avg", "min", "max"):
+                    self.assertAlmostEqual(actual[field], expected[field], places=6)
+                for field in ("median", "p95", "p99"):
+                    self.assertLessEqual(abs(actual[field] - expected[field]), 0.02 * abs(expected[field]) + 1e-9)
+    
+    def test_stats_update_after_new_samples(self):
+        """Cached stats are recomputed once a histogram receives samples"""
+        self.registry.record_histogram("h", 1)
+        self.assertEqual(self.registry.get_metrics()["histograms"]["h"]["max"], 1)
+        self.registry.record_histogram("h", 3)
+        stats = self.registry.get_metrics()["histograms"]["h"]
+        self.assertEqual(stats["count"], 2)
+        self.assertEqual(stats["max"], 3)
+    
+    def test_infinite_values_are_recorded(self):
+        """inf goes to the overflow bucket instead of raising"""
+        self.registry.record_histogram("x", 1.0)
+        self.registry.record_histogram("x", math.inf)
+        self.registry.record_histogram("x", -math.inf)
+        stats = self.registry.get_metrics()["histograms"]["x"]
+        self.assertEqual(stats["count"], 3)
+        self.assertEqual(stats["max"], math.inf)
+        self.assertEqual(stats["min"], -math.inf)
+        self.assertEqual(stats["p99"], math.inf)
+    
+    def test_nan_values_are_dropped(self):
+        """NaN is ignored instead of poisoning sum and average"""
+        self.registry.record_histogram("x", 2.0)
+        self.registry.record_histogram("x", math.nan)
+        self.registry.record_histogram("only_nan", math.nan)
+        histograms = self.registry.get_metrics()["histograms"]
+        self.assertEqual(histograms["x"]["count"], 1)
+        self.assertEqual(histograms["x"]["avg"], 2.0)
+        self.assertNotIn("only_nan", histograms)
+
+class TestNdjsonMetricsLog(unittest.TestCase):
+    """Test cases for the rotating NDJSON metrics log"""
+    
+    def setUp(self):
+        """Create a temporary log directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "metrics.ndjson.gz"
+    
+    def tearDown(self):
+        """Remove the temporary log directory"""
+        self.temp_dir.cleanup()
+    
+    def test_rotations_within_one_second_keep_every_snapshot(self):
+        """Rotated files get unique names instead of overwriting each other"""
+        with mock.patch.object(monitoring, "_NDJSON_ROTATE_BYTES", 1):
+            log = monitoring._NdjsonMetricsLog(self.path)
+            for index in range(5):
+                log.write({"index": index})
+            log.close()
+        
+        rotated = [path for path in Path(self.temp_dir.name).iterdir() if path != self.path]
+        self.assertEqual(len(rotated), 5)
+        indexes = []
+        for path in rotated:
+            with gzip.open(path, "rt") as handle:
+                indexes.extend(json.loads(line)["index"] for line in handle)
+        self.assertEqual(sorted(indexes), list(range(5)))
+    
+    def test_write_after_close_is_ignored(self):
+        """A late export after close() does not raise"""
+        log = monitoring._NdjsonMetricsLog(self.path)
+        log.write({"index": 0})
+        log.close()
+        log.write({"index": 1})
+        with gzip.open(self.path, "rt") as handle:
+            self.assertEqual([json.loads(line)["index"] for line in handle], [0])
+
+class TestPeriodicScheduler(unittest.TestCase):
+    """Test cases for the shared periodic job scheduler"""
+    
+    def setUp(self):
+        """Create a private scheduler"""
+        self.scheduler = monitoring._PeriodicScheduler()
+    
+    def test_cancelled_job_stops_running(self):
+        """No runs happen after cancel() returns"""
+        runs = []
+        job = self.scheduler.schedule(0.01, lambda: runs.append(time.monotonic()))
+        time.sleep(0.1)
+        self.scheduler.cancel(job)
+        count = len(runs)
+        time.sleep(0.1)
+        self.assertGreater(count, 0)
+        self.assertEqual(len(runs), count)
+    
+    def test_cancel_waits_for_running_job(self):
+        """cancel() returns only after an in-progress run has finished"""
+        started = threading.Event()
+        finished = threading.Event()
+        
+        def slow_job():
+            started.set()
+            time.sleep(0.2)
+            finished.set()
+        
+        job = self.scheduler.schedule(0.01, slow_job)
+        self.assertTrue(started.wait(2))
+        self.scheduler.cancel(job)
+        self.assertTrue(finished.is_set())
+    
+    def test_job_can_cancel_itself(self):
+        """A job cancelling itself does not deadlock the scheduler thread"""
+        runs = []
+        holder = {}
+        
+        def once():
+            runs.append(1)
+            self.scheduler.cancel(holder["job"])
+        
+        holder["job"] = self.scheduler.schedule(0.01, once)
+        time.sleep(0.2)
+        self.assertEqual(runs, [1])
+    
+    def test_thread_exits_when_all_jobs_cancelled(self):
+        """The scheduler thread stops once no jobs remain and restarts on demand"""
+        first = self.scheduler.schedule(0.01, lambda: None)
+        second = self.scheduler.schedule(0.05, lambda: None)
+        thread = self.scheduler._thread
+        self.scheduler.cancel(first)
+        self.scheduler.cancel(second)
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(self.scheduler._thread)
+        
+        ran = threading.Event()
+        job = self.scheduler.schedule(0.01, ran.set)
+        self.assertTrue(ran.wait(2))
+        self.scheduler.cancel(job)
+    
+    def test_failing_job_keeps_running(self):
+        """An exception in one run does not stop later runs"""
+        runs = []
+        
+        def failing():
+            runs.append(1)
+            raise RuntimeError("boom")
+        
+        job = self.scheduler.schedule(0.01, failing)
+        time.sleep(0.1)
+        self.scheduler.cancel(job)
+        self.assertGreater(len(runs), 1)
+
+if __name__ == '__main__':
+    unittest.main()
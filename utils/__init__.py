@@ -6,7 +6,7 @@ including helpers for logging, monitoring, notifications, and retry logic.
 """
 
 from utils.helpers import (
-    get_random_user_agent, rate_limit, detect_captcha, 
+    get_random_user_agent, rate_limit, rate_limit_for, detect_captcha, 
     get_proxy_settings, load_config_from_env, setup_logger
 )
 
@@ -18,9 +18,12 @@ import json
 import os
 import re
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Callable, Union, Tuple, Set
-from collections import defaultdict, Counter
+import queue
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Callable, Union, Tuple, Set, Deque
+from collections import defaultdict, Counter, deque
 import jsonschema
 from pathlib import Path
 
@@ -34,13 +37,55 @@ try:
     logger = setup_advanced_logger(
         name=__name__,
         console=True,
-        log_level=os.environ.get("LOG_LEVEL", "INFO")
+        log_level=os.environ.get("LOG_LEVEL", "INFO"),
+        # validate_dataset logs from forked ProcessPoolExecutor workers,
+        # which would not inherit a queue listener thread
+        use_queue=False
     )
 except (ImportError, NameError):
     # Fall back to basic logging
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     logger = logging.getLogger(__name__)
 
+# Format for timestamps embedded in report filenames
+_FILENAME_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+def _iso_timestamp() -> str:
+    """
+    Get the current local time as an ISO 8601 string.
+    
+    Formats straight from time.time() so no datetime object is built.
+    
+    Returns:
+        Timestamp with microsecond precision
+    """
+    now = time.time()
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now)) + f".{int(now % 1 * 1e6):06d}"
+
+# Number of history entries kept per data source
+_MAX_HISTORY_ENTRIES = 100
+
+# Minimum dataset size for which validate_dataset splits the work across
+# worker processes
+_PARALLEL_MIN_RECORDS = 10000
+
+# Field-level summary issues of the per-record checks, as issue_type:
+# (threshold the share of records must exceed or None, description)
+_FIELD_SUMMARIES = {
+    "missing_required": ("missing_threshold", "{field} missing in {count} records ({percentage:.1%})"),
+    "invalid_format": ("invalid_threshold", "{field} has invalid format in {count} records ({percentage:.1%})"),
+    "suspicious_pattern": (None, "{field} contains suspicious patterns in {count} records ({percentage:.1%})"),
+}
+
+# Score penalty weights per issue type, as (issue_type, weight) pairs
+_ISSUE_WEIGHTS = (
+    ("missing_required", 10.0),  # Higher impact
+    ("invalid_format", 8.0),
+    ("duplicate_record", 5.0),
+    ("suspicious_pattern", 4.0),
+    ("anomaly", 2.0),  # Lower impact
+)
+
 class DataQualityConfig:
     """
     Configuration for data quality monitoring rules and thresholds.
@@ -293,15 +338,24 @@ class DataQualityMonitor:
         self.schema = schema or DataQualitySchema()
         self.notification_manager = notification_manager
         
-        # Store history of quality scores
+        # Quality alerts are delivered by a background worker so that
+        # notification I/O does not block dataset processing
+        self._alert_queue = queue.SimpleQueue()
+        self._alert_thread = None
+        self._alert_finalizer = None
+        
+        # Store history of quality scores, with the scores of each source
+        # also kept in a bounded buffer so trends can be computed without
+        # walking the history entries
         self.quality_history = defaultdict(list)
+        self._score_history: Dict[str, Deque[float]] = {}
         
         # Initialize statistics
         self.statistics = {
             "total_records_processed": 0,
             "records_with_issues": 0,
-            "fields_with_issues": defaultdict(int),
-            "issue_types": defaultdict(int),
+            "fields_with_issues": Counter(),
+            "issue_types": Counter(),
             "last_processing_time": None,
             "quality_score": 100.0
         }
@@ -339,6 +393,7 @@ class DataQualityMonitor:
             Quality assessment results
         """
         start_time = time.time()
+        timestamp = _iso_timestamp()
         
         if data.empty:
             logger.warning(f"Empty dataset received from {source_name}")
@@ -348,7 +403,7 @@ class DataQualityMonitor:
                 "records_processed": 0,
                 "records_with_issues": 0,
                 "source": source_name,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
         
         # Initialize results
@@ -356,16 +411,16 @@ class DataQualityMonitor:
             "issues": [],
             "records_processed": len(data),
             "records_with_issues": 0,
-            "field_issues": defaultdict(int),
-            "issue_types": defaultdict(int),
+            "field_issues": Counter(),
+            "issue_types": Counter(),
             "suspicious_records": [],
             "source": source_name,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
         # Update statistics
         self.statistics["total_records_processed"] += len(data)
-        self.statistics["last_processing_time"] = datetime.now().isoformat()
+        self.statistics["last_processing_time"] = timestamp
         
         # Track metrics
         self.metrics.set_gauge("data_quality.records_processed", self.statistics["total_records_processed"])
@@ -401,15 +456,12 @@ class DataQualityMonitor:
             results["issues"].extend(anomaly_issues)
         
         # Calculate field-specific issue counts
-        for issue in results["issues"]:
-            if "field" in issue:
-                results["field_issues"][issue["field"]] += 1
-            
-            results["issue_types"][issue["type"]] += 1
-            
-            # Update global statistics
-            self.statistics["fields_with_issues"][issue.get("field", "unknown")] += 1
-            self.statistics["issue_types"][issue["type"]] += 1
+        results["field_issues"].update(issue["field"] for issue in results["issues"] if "field" in issue)
+        results["issue_types"].update(issue["type"] for issue in results["issues"])
+        
+        # Update global statistics
+        self.statistics["fields_with_issues"].update(issue.get("field", "unknown") for issue in results["issues"])
+        self.statistics["issue_types"].update(results["issue_types"])
         
         # Count records with issues
         records_with_issues = set()
@@ -434,16 +486,7 @@ class DataQualityMonitor:
         self.metrics.set_gauge("data_quality.score", quality_score)
         
         # Store in history
-        self.quality_history[source_name].append({
-            "timestamp": datetime.now().isoformat(),
-            "quality_score": quality_score,
-            "records_processed": len(data),
-            "records_with_issues": results["records_with_issues"]
-        })
-        
-        # Trim history to last 100 entries per source
-        if len(self.quality_history[source_name]) > 100:
-            self.quality_history[source_name] = self.quality_history[source_name][-100:]
+        self._record_history(results, source_name)
         
         # Check if quality score is below threshold and send notification if needed
         if quality_score < 70 and self.notification_manager:
@@ -455,6 +498,145 @@ class DataQualityMonitor:
         
         return results
     
+    def _record_history(self, results: Dict[str, Any], source_name: str) -> None:
+        """
+        Append an assessment to the quality history of its source.
+        
+        Args:
+            results: Quality assessment results, including the quality score
+            source_name: Name of the data source
+        """
+        quality_score = results["quality_score"]
+        self.quality_history[source_name].append({
+            "timestamp": results["timestamp"],
+            "quality_score": quality_score,
+            "records_processed": results["records_processed"],
+            "records_with_issues": results["records_with_issues"]
+        })
+        
+        scores = self._score_history.get(source_name)
+        if scores is None:
+            scores = self._score_history[source_name] = deque(maxlen=_MAX_HISTORY_ENTRIES)
+        scores.append(quality_score)
+        
+        # Trim history to last entries per source
+        if len(self.quality_history[source_name]) > _MAX_HISTORY_ENTRIES:
+            self.quality_history[source_name] = self.quality_history[source_name][-_MAX_HISTORY_ENTRIES:]
+    
+    def _absorb_results(self, results: Dict[str, Any], source_name: str) -> Dict[str, Any]:
+        """
+        Fold results assessed by other monitors (e.g. partitions validated in
+        worker processes) into this monitor, as process_dataset would.
+        
+        Args:
+            results: Merged quality assessment results without a quality score
+            source_name: Name of the data source
+            
+        Returns:
+            The results with their quality score
+        """
+        self.statistics["total_records_processed"] += results["records_processed"]
+        self.statistics["last_processing_time"] = results["timestamp"]
+        self.statistics["fields_with_issues"].update(issue.get("field", "unknown") for issue in results["issues"])
+        self.statistics["issue_types"].update(results["issue_types"])
+        self.statistics["records_with_issues"] += results["records_with_issues"]
+        
+        # Update metrics
+        self.metrics.set_gauge("data_quality.records_processed", self.statistics["total_records_processed"])
+        self.metrics.set_gauge("data_quality.records_with_issues", self.statistics["records_with_issues"])
+        for issue_type, count in results["issue_types"].items():
+            self.metrics.inc_counter(f"data_quality.issues.{issue_type}", count)
+        
+        results["quality_score"] = self._calculate_quality_score(results)
+        self.metrics.set_gauge("data_quality.score", results["quality_score"])
+        
+        self._record_history(results, source_name)
+        
+        if results["quality_score"] < 70 and self.notification_manager:
+            self._send_quality_alert(results, source_name)
+        
+        return results
+    
+    def _check_records(self, data: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Run the checks that judge each record on its own, for one partition
+        of a dataset.
+        
+        Field-level summary issues are left out, as they depend on the
+        whole dataset; _merge_partition_results rebuilds them.
+        
+        Args:
+            data: Partition to check
+            
+        Returns:
+            Record-level issues and the indices of suspicious records
+        """
+        issues = self._check_missing_values(data) + self._validate_field_formats(data)
+        suspicious_issues, suspicious_indices = self._check_suspicious_patterns(data)
+        issues.extend(suspicious_issues)
+        
+        return {
+            "issues": [issue for issue in issues if "record_index" in issue],
+            "suspicious_indices": suspicious_indices
+        }
+    
+    def _merge_partition_results(
+        self,
+        data: pd.DataFrame,
+        partials: List[Dict[str, Any]],
+        source_name: str
+    ) -> Dict[str, Any]:
+        """
+        Combine the per-record checks of dataset partitions with the checks
+        that need the whole dataset, giving the results process_dataset
+        would.
+        
+        Args:
+            data: Whole dataset
+            partials: _check_records results of each partition, in order
+            source_name: Name of the data source
+            
+        Returns:
+            Quality assessment results without a quality score
+        """
+        results = {
+            "issues": [],
+            "records_processed": len(data),
+            "records_with_issues": 0,
+            "field_issues": Counter(),
+            "issue_types": Counter(),
+            "suspicious_records": [],
+            "source": source_name,
+            "timestamp": _iso_timestamp()
+        }
+        
+        record_issues = [issue for partial in partials for issue in partial["issues"]]
+        
+        # Field-level summaries, from the record-level issues of all partitions
+        field_counts = Counter((issue["type"], issue["field"]) for issue in record_issues)
+        for (issue_type, field), count in field_counts.items():
+            summary = self._field_summary_issue(issue_type, field, count, len(data))
+            if summary:
+                results["issues"].append(summary)
+        results["issues"].extend(record_issues)
+        
+        # Duplicates and anomalies are only found by comparing all records
+        results["issues"].extend(self._check_duplicates(data))
+        results["issues"].extend(self._detect_anomalies(data))
+        
+        for partial in partials:
+            for idx in partial["suspicious_indices"]:
+                if idx < len(data):
+                    results["suspicious_records"].append(data.iloc[idx].to_dict())
+        
+        results["field_issues"].update(issue["field"] for issue in results["issues"] if "field" in issue)
+        results["issue_types"].update(issue["type"] for issue in results["issues"])
+        results["records_with_issues"] = len({
+            issue["record_index"] for issue in results["issues"] if "record_index" in issue
+        })
+        
+        return results
+    
     def _check_missing_values(self, data: pd.DataFrame) -> List[Dict[str, Any]]:
         """
         Check for missing values in required fields.
@@ -467,23 +649,15 @@ class DataQualityMonitor:
         """
         issues = []
         field_rules = self.config.get_field_rules()
-        missing_threshold = self.config.get_threshold("missing_threshold")
         
         for field, rules in field_rules.items():
             if rules.get("required", False) and field in data.columns:
                 missing_count = data[field].isna().sum()
                 if missing_count > 0:
-                    missing_pct = missing_count / len(data)
-                    
                     # Add overall issue if above threshold
-                    if missing_pct > missing_threshold:
-                        issues.append({
-                            "type": "missing_required",
-                            "field": field,
-                            "description": f"{field} missing in {missing_count} records ({missing_pct:.1%})",
-                            "count": missing_count,
-                            "percentage": missing_pct
-                        })
+                    summary = self._field_summary_issue("missing_required", field, missing_count, len(data))
+                    if summary:
+                        issues.append(summary)
                     
                     # Add record-specific issues
                     for idx in data[data[field].isna()].index:
@@ -508,7 +682,6 @@ class DataQualityMonitor:
         """
         issues = []
         field_rules = self.config.get_field_rules()
-        invalid_threshold = self.config.get_threshold("invalid_threshold")
         
         for field, rules in field_rules.items():
             if field not in data.columns:
@@ -555,17 +728,10 @@ class DataQualityMonitor:
             # Add issues
             invalid_count = len(invalid_indices)
             if invalid_count > 0:
-                invalid_pct = invalid_count / len(data)
-                
                 # Add overall issue if above threshold
-                if invalid_pct > invalid_threshold:
-                    issues.append({
-                        "type": "invalid_format",
-                        "field": field,
-                        "description": f"{field} has invalid format in {invalid_count} records ({invalid_pct:.1%})",
-                        "count": invalid_count,
-                        "percentage": invalid_pct
-                    })
+                summary = self._field_summary_issue("invalid_format", field, invalid_count, len(data))
+                if summary:
+                    issues.append(summary)
                 
                 # Add record-specific issues
                 for idx in invalid_indices:
@@ -689,17 +855,43 @@ class DataQualityMonitor:
             
             # Add field-level issue if there are suspicious patterns
             if suspicious_count > 0:
-                suspicious_pct = suspicious_count / len(data)
-                issues.append({
-                    "type": "suspicious_pattern",
-                    "field": field,
-                    "description": f"{field} contains suspicious patterns in {suspicious_count} records ({suspicious_pct:.1%})",
-                    "count": suspicious_count,
-                    "percentage": suspicious_pct
-                })
+                issues.append(self._field_summary_issue("suspicious_pattern", field, suspicious_count, len(data)))
         
         return issues, list(suspicious_indices)
     
+    def _field_summary_issue(
+        self,
+        issue_type: str,
+        field: str,
+        count: int,
+        total: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the field-level summary issue of a per-record check.
+        
+        Args:
+            issue_type: Type of the record-level issues
+            field: Field the issues were found in
+            count: Number of record-level issues for the field
+            total: Number of records checked
+            
+        Returns:
+            Summary issue, or None if the share of records is within the
+            check's threshold
+        """
+        threshold_name, description = _FIELD_SUMMARIES[issue_type]
+        percentage = count / total
+        if threshold_name is not None and percentage <= self.config.get_threshold(threshold_name):
+            return None
+        
+        return {
+            "type": issue_type,
+            "field": field,
+            "description": description.format(field=field, count=count, percentage=percentage),
+            "count": count,
+            "percentage": percentage
+        }
+    
     def _detect_anomalies(self, data: pd.DataFrame) -> List[Dict[str, Any]]:
         """
         Detect statistical anomalies in data.
@@ -801,22 +993,18 @@ class DataQualityMonitor:
         if results["records_processed"] == 0:
             return 0.0  # No records
         
-        # Decrease score based on issue percentages
-        issue_weights = {
-            "missing_required": 10.0,  # Higher impact
-            "invalid_format": 8.0,
-            "duplicate_record": 5.0,
-            "suspicious_pattern": 4.0,
-            "anomaly": 2.0  # Lower impact
-        }
+        records_processed = results["records_processed"]
+        issue_types = results["issue_types"]
         
-        for issue_type, count in results["issue_types"].items():
-            if issue_type in issue_weights:
-                issue_pct = count / results["records_processed"]
-                score -= issue_pct * issue_weights[issue_type] * 100
+        # Decrease score based on issue percentages
+        weighted_issues = sum(
+            issue_types.get(issue_type, 0) * weight
+            for issue_type, weight in _ISSUE_WEIGHTS
+        )
+        score -= weighted_issues / records_processed * 100
         
         # Also penalize for high percentage of records with issues
-        records_with_issues_pct = results["records_with_issues"] / results["records_processed"]
+        records_with_issues_pct = results["records_with_issues"] / records_processed
         score -= records_with_issues_pct * 20  # Up to 20 points off for 100% records with issues
         
         # Ensure score is within range 0-100
@@ -826,7 +1014,9 @@ class DataQualityMonitor:
     
     def _send_quality_alert(self, results: Dict[str, Any], source_name: str) -> None:
         """
-        Send alert for poor data quality.
+        Queue an alert for poor data quality.
+        
+        The alert is formatted and sent by a background worker thread.
         
         Args:
             results: Quality assessment results
@@ -835,20 +1025,94 @@ class DataQualityMonitor:
         if not self.notification_manager:
             return
         
+        if self._alert_thread is None:
+            # The worker and the finalizer only hold what delivery needs, so
+            # the monitor can still be collected while the worker runs
+            self._alert_thread = threading.Thread(
+                target=DataQualityMonitor._alert_worker,
+                args=(self._alert_queue, self.notification_manager, self.issue_categories),
+                daemon=True,
+                name="data-quality-alerts"
+            )
+            self._alert_thread.start()
+            # Deliver queued alerts before the daemon worker is killed at
+            # interpreter exit, or once the monitor is collected
+            self._alert_finalizer = weakref.finalize(
+                self, DataQualityMonitor._stop_alert_worker, self._alert_queue, self._alert_thread
+            )
+        
+        # Snapshot the fields used by the alert so later changes to the
+        # results do not race with the worker
+        snapshot = {
+            "quality_score": results["quality_score"],
+            "records_processed": results["records_processed"],
+            "records_with_issues": results["records_with_issues"],
+            "issue_types": dict(results["issue_types"])
+        }
+        self._alert_queue.put((snapshot, source_name))
+    
+    @staticmethod
+    def _alert_worker(
+        alert_queue: queue.SimpleQueue,
+        notification_manager: Any,
+        issue_categories: Dict[str, str]
+    ) -> None:
+        """
+        Deliver queued quality alerts until the worker is stopped.
+        
+        Args:
+            alert_queue: Queue of (results, source name) alerts
+            notification_manager: Notification manager sending the alerts
+            issue_categories: Display names of the issue types
+        """
+        while True:
+            item = alert_queue.get()
+            if item is None:
+                break
+            
+            try:
+                DataQualityMonitor._deliver_quality_alert(
+                    notification_manager, issue_categories, *item
+                )
+            except Exception as e:
+                logger.error(f"Error sending data quality alert: {str(e)}")
+    
+    @staticmethod
+    def _deliver_quality_alert(
+        notification_manager: Any,
+        issue_categories: Dict[str, str],
+        results: Dict[str, Any],
+        source_name: str
+    ) -> None:
+        """
+        Send alert for poor data quality.
+        
+        Args:
+            notification_manager: Notification manager sending the alert
+            issue_categories: Display names of the issue types
+            results: Quality assessment results
+            source_name: Name of the data source
+        """
         # Format message
         title = f"Data Quality Alert: {source_name}"
         
-        message = f"Data quality score: {results['quality_score']:.1f}/100\n"
-        message += f"Records processed: {results['records_processed']}\n"
-        message += f"Records with issues: {results['records_with_issues']} ({results['records_with_issues']/results['records_processed']:.1%})\n\n"
+        records_with_issues_pct = results["records_with_issues"] / results["records_processed"]
         
-        message += "Key issues:\n"
-        for issue_type, count in results["issue_types"].items():
-            if count > 0:
-                message += f"- {self.issue_categories.get(issue_type, issue_type)}: {count} occurrences\n"
+        parts = [
+            f"Data quality score: {results['quality_score']:.1f}/100\n",
+            f"Records processed: {results['records_processed']}\n",
+            f"Records with issues: {results['records_with_issues']} ({records_with_issues_pct:.1%})\n\n",
+            "Key issues:\n"
+        ]
+        parts.extend(
+            f"- {issue_categories.get(issue_type, issue_type)}: {count} occurrences\n"
+            for issue_type, count in results["issue_types"].items()
+            if count > 0
+        )
+        message = "".join(parts)
         
         # Send notification
-        self.notification_manager.send_notification(
+        notification_manager.send_notification(
             title=title,
             message=message,
             level="warning",
@@ -857,6 +1121,29 @@ class DataQualityMonitor:
         
         logger.warning(f"Data quality alert sent for {source_name}: score={results['quality_score']:.1f}")
     
+    @staticmethod
+    def _stop_alert_worker(alert_queue: queue.SimpleQueue, alert_thread: threading.Thread) -> None:
+        """
+        Finalizer callback; stops the alert worker after it has delivered
+        the queued alerts.
+        
+        Args:
+            alert_queue: Queue the worker reads alerts from
+            alert_thread: Worker thread
+        """
+        alert_queue.put(None)
+        alert_thread.join(timeout=5)
+    
+    def close(self) -> None:
+        """
+        Stop the alert worker after delivering any queued alerts.
+        """
+        if self._alert_thread is None:
+            return
+        
+        self._alert_finalizer()
+        self._alert_thread = None
+    
     def get_quality_history(self, source_name: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
         """
         Get history of quality scores.
@@ -891,15 +1178,8 @@ class DataQualityMonitor:
         Returns:
             Data quality report
         """
-        report = {
-            "timestamp": datetime.now().isoformat(),
-            "total_records_processed": self.statistics["total_records_processed"],
-            "total_records_with_issues": self.statistics["records_with_issues"],
-            "overall_quality_score": self.statistics.get("quality_score", 100.0),
-            "issue_summary": dict(self.statistics["issue_types"]),
-            "field_issues": dict(self.statistics["fields_with_issues"]),
-            "history": {}
-        }
+        report = self._report_summary()
+        report["history"] = {}
         
         # Add history
         if source_name:
@@ -908,14 +1188,47 @@ class DataQualityMonitor:
             report["history"] = self.get_quality_history()
         
         # Calculate trends
-        for src, history in report["history"].items():
-            if len(history) >= 2:
-                oldest = history[0]["quality_score"]
-                newest = history[-1]["quality_score"]
-                report["history"][src + "_trend"] = newest - oldest
+        for src in list(report["history"]):
+            trend = self._history_trend(src)
+            if trend is not None:
+                report["history"][src + "_trend"] = trend
         
         return report
     
+    def _report_summary(self) -> Dict[str, Any]:
+        """
+        Build the scalar summary section of a quality report.
+        
+        Returns:
+            Report fields other than the history
+        """
+        return {
+            "timestamp": _iso_timestamp(),
+            "total_records_processed": self.statistics["total_records_processed"],
+            "total_records_with_issues": self.statistics["records_with_issues"],
+            "overall_quality_score": self.statistics.get("quality_score", 100.0),
+            "issue_summary": dict(self.statistics["issue_types"]),
+            "field_issues": dict(self.statistics["fields_with_issues"])
+        }
+    
+    def _history_trend(self, source_name: str) -> Optional[float]:
+        """
+        Calculate the quality score trend of a data source.
+        
+        Args:
+            source_name: Name of the data source
+            
+        Returns:
+            Difference between newest and oldest score, or None if there
+            are fewer than two history entries
+        """
+        history = self._score_history.get(source_name)
+        if history is None or len(history) < 2:
+            return None
+        
+        scores = np.fromiter(history, dtype=np.float64, count=len(history))
+        return float(scores[-1] - scores[0])
+    
     def export_report(self, directory: str, source_name: Optional[str] = None) -> str:
         """
         Export data quality report to file.
@@ -928,14 +1241,16 @@ class DataQualityMonitor:
             Path to exported report
         """
         # Create directory if it doesn't exist
-        if not os.path.exists(directory):
-            os.makedirs(directory)
+        os.makedirs(directory, exist_ok=True)
         
-        # Generate report
-        report = self.generate_quality_report(source_name)
+        # Select history to export
+        if source_name:
+            histories = {source_name: self.quality_history.get(source_name, [])}
+        else:
+            histories = self.quality_history
         
         # Create filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime(_FILENAME_TIMESTAMP_FORMAT)
         if source_name:
             filename = f"data_quality_{source_name}_{timestamp}.json"
         else:
@@ -943,9 +1258,38 @@ class DataQualityMonitor:
         
         filepath = os.path.join(directory, filename)
         
-        # Write report to file
+        # Stream report to file, one history entry at a time, so the full
+        # report never has to be materialized in memory
         with open(filepath, 'w') as f:
-            json.dump(report, f, indent=2)
+            f.write('{')
+            for key, value in self._report_summary().items():
+                json.dump(key, f)
+                f.write(': ')
+                json.dump(value, f)
+                f.write(', ')
+            
+            f.write('"history": {')
+            first_source = True
+            for src, history in histories.items():
+                if not first_source:
+                    f.write(', ')
+                first_source = False
+                
+                json.dump(src, f)
+                f.write(': [')
+                for i, entry in enumerate(history):
+                    if i:
+                        f.write(', ')
+                    json.dump(entry, f)
+                f.write(']')
+                
+                trend = self._history_trend(src)
+                if trend is not None:
+                    f.write(', ')
+                    json.dump(src + "_trend", f)
+                    f.write(': ')
+                    json.dump(trend, f)
+            f.write('}}')
         
         logger.info(f"Data quality report exported to {filepath}")
         
@@ -953,30 +1297,74 @@ class DataQualityMonitor:
 
 # Helper functions for integration with data processors
 
+def _validate_partition(data: pd.DataFrame, config: DataQualityConfig) -> Dict[str, Any]:
+    """
+    Run the per-record checks on one partition of a dataset in a worker
+    process.
+    
+    Args:
+        data: Partition to validate
+        config: Data quality configuration
+        
+    Returns:
+        Record-level issues and suspicious record indices of the partition
+    """
+    monitor = DataQualityMonitor(MetricsRegistry(), config)
+    return monitor._check_records(data)
+
 def validate_dataset(
     data: pd.DataFrame,
     metrics_registry: MetricsRegistry,
     source_name: str = "unknown",
     config_path: Optional[str] = None,
-    notification_manager = None
+    notification_manager = None,
+    workers: Optional[int] = 1
 ) -> Dict[str, Any]:
     """
     Validate a dataset and assess its quality.
     
+    With more than one worker, datasets of at least _PARALLEL_MIN_RECORDS
+    records are split into partitions whose records are checked in separate
+    processes. Duplicate and anomaly checks, which compare records with each
+    other, run on the whole dataset, so the results match a serial run apart
+    from the order of the issues.
+    
     Args:
         data: DataFrame to validate
         metrics_registry: Registry for tracking metrics
         source_name: Name of the data source
         config_path: Optional path to configuration file
         notification_manager: Optional notification manager
+        workers: Number of worker processes (os.cpu_count() if None)
         
     Returns:
         Quality assessment results
+        
+    Raises:
+        ValueError: If workers is less than 1
     """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    
     config = DataQualityConfig(config_path)
     monitor = DataQualityMonitor(metrics_registry, config, notification_manager=notification_manager)
     
-    return monitor.process_dataset(data, source_name)
+    try:
+        if workers <= 1 or len(data) < _PARALLEL_MIN_RECORDS:
+            return monitor.process_dataset(data, source_name)
+        
+        partitions = [data.iloc[rows] for rows in np.array_split(np.arange(len(data)), workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials = list(executor.map(_validate_partition, partitions, [config] * workers))
+        
+        return monitor._absorb_results(
+            monitor._merge_partition_results(data, partials, source_name), source_name
+        )
+    finally:
+        # Deliver any queued quality alert before the monitor is discarded
+        monitor.close()
 
 def create_data_quality_monitor(
     metrics_registry: MetricsRegistry,
@@ -1001,6 +1389,22 @@ def create_data_quality_monitor(
     
     return DataQualityMonitor(metrics_registry, config, schema, notification_manager)
 
+def _read_csv(path: str) -> pd.DataFrame:
+    """
+    Load a CSV file, using the multi-threaded pyarrow parser when available.
+    
+    Args:
+        path: Path to the CSV file
+        
+    Returns:
+        Loaded data
+    """
+    try:
+        return pd.read_csv(path, engine="pyarrow")
+    except (ImportError, ValueError):
+        # pyarrow not installed or file not supported by its parser
+        return pd.read_csv(path)
+
 def main():
     """
     Main function for testing data quality monitoring.
@@ -1024,7 +1428,7 @@ def main():
     if args.data_file:
         # Load data
         try:
-            data = pd.read_csv(args.data_file)
+            data = _read_csv(args.data_file)
             logger.info(f"Loaded {len(data)} records from {args.data_file}")
             
             # Create monitor
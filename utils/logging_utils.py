@@ -12,18 +12,31 @@ This module provides enhanced logging functionality including:
 - Integration with monitoring and alerting systems
 """
 
+import atexit
+import copy
+import functools
 import logging
 import logging.handlers
 import os
 import json
+import queue
+import re
 import socket
 import sys
+import threading
 import time
-import traceback
 import uuid
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, Any, Optional, Union, List, Callable
 
+# Try to import orjson for faster JSON logs, but don't fail if it's not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Custom log levels for more granular logging
 TRACE = 5  # More detailed than DEBUG
 logging.addLevelName(TRACE, "TRACE")
@@ -38,6 +51,105 @@ SEVERITY_MAP = {
     TRACE: "TRACE"
 }
 
+# Host name included in JSON logs; it does not change while the process runs
+_HOSTNAME = socket.gethostname()
+
+# Standard LogRecord attributes, which JsonFormatter does not copy as extras
+_RESERVED_RECORD_ATTRS = frozenset({
+    "args", "asctime", "created", "exc_info", "exc_text", "filename",
+    "funcName", "id", "levelname", "levelno", "lineno", "module", "msecs",
+    "message", "msg", "name", "pathname", "process", "processName",
+    "relativeCreated", "stack_info", "taskName", "thread", "threadName"
+})
+
+# Patterns for sensitive data masked by SensitiveDataFilter. The first group
+# of a pattern holds the value to mask; patterns without groups mask the
+# whole match.
+_DEFAULT_SENSITIVE_PATTERNS = {
+    "password": r"password[\"']?\s*:\s*[\"']([^\"']+)[\"']",
+    "api_key": r"api_key[\"']?\s*:\s*[\"']([^\"']+)[\"']",
+    "auth": r"auth[\"']?\s*:\s*[\"']([^\"']+)[\"']",
+    "token": r"token[\"']?\s*:\s*[\"']([^\"']+)[\"']",
+    "authorization": r"Authorization[\"']?\s*:\s*[\"']([^\"']+)[\"']",
+    "secret": r"secret[\"']?\s*:\s*[\"']([^\"']+)[\"']",
+    "email": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
+    "phone": r"(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"
+}
+
+# Text every match of a default pattern contains, so patterns that cannot
+# match are skipped without running them
+_SENSITIVE_PATTERN_MARKERS = {
+    "password": "password",
+    "api_key": "api_key",
+    "auth": "auth",
+    "token": "token",
+    "authorization": "Authorization",
+    "secret": "secret",
+    "email": "@",
+}
+
+_DEFAULT_COMPILED_PATTERNS = tuple(
+    (_SENSITIVE_PATTERN_MARKERS.get(name), re.compile(pattern))
+    for name, pattern in _DEFAULT_SENSITIVE_PATTERNS.items()
+)
+
+_MASK_LENGTH = 6
+
+# Longest string whose masked form SensitiveDataFilter caches; longer ones
+# (HTML snippets, tracebacks) rarely repeat and would make the cache large
+_MASK_CACHE_MAX_LENGTH = 256
+
+def _mask_match(match: re.Match) -> str:
+    """
+    Mask a sensitive data match, keeping the first and last character of
+    the masked value.
+    
+    Args:
+        match: Match of a sensitive data pattern
+    
+    Returns:
+        Matched text with its sensitive value masked
+    """
+    text = match.group(0)
+    value = match.group(1) if match.re.groups else None
+    if not value:
+        value = text
+    masked = value[0] + "*" * _MASK_LENGTH + (value[-1] if len(value) > 1 else "")
+    return text.replace(value, masked)
+
+def _mask_sensitive(text: str, patterns: tuple) -> str:
+    """
+    Mask all sensitive data in a string.
+    
+    Args:
+        text: String to mask
+        patterns: (required marker or None, compiled pattern) pairs
+    
+    Returns:
+        String with sensitive values masked
+    """
+    for marker, pattern in patterns:
+        if marker is None or marker in text:
+            text = pattern.sub(_mask_match, text)
+    return text
+
+def _json_dumps(data: Dict[str, Any]) -> str:
+    """
+    Serialize log data to a JSON string, using orjson when available.
+    
+    Values that are not JSON serializable are written with str(), and
+    non-string dict keys are converted to strings, as json.dumps does.
+    
+    Args:
+        data: Log data to serialize
+    
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, default=str)
+
 class JsonFormatter(logging.Formatter):
     """
     Formatter that outputs JSON strings after formatting the log record.
@@ -47,14 +159,42 @@ class JsonFormatter(logging.Formatter):
         Initialize the formatter with specified JSON fields.
         """
         self.json_fields = kwargs
-        self.hostname = socket.gethostname()
+        self.hostname = _HOSTNAME
+        # (whole second, formatted UTC time) of the last record formatted
+        self._second_cache = (None, "")
+    
+    def _timestamp(self, created: float) -> str:
+        """
+        Format a record creation time as an ISO 8601 UTC timestamp.
+        
+        Records arrive many per second, so the formatted date and time is
+        reused for records within the same second.
+        
+        Args:
+            created: Record creation time in seconds since the epoch
+        
+        Returns:
+            Timestamp such as "2024-01-31T12:00:00.123456Z"
+        """
+        second = int(created)
+        micros = round((created - second) * 1e6)
+        if micros >= 1_000_000:
+            second += 1
+            micros -= 1_000_000
+        
+        cached_second, formatted = self._second_cache
+        if second != cached_second:
+            formatted = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_cache = (second, formatted)
+        
+        return f"{formatted}.{micros:06d}Z"
         
     def format(self, record):
         """
         Format the specified record as JSON.
         """
         log_data = {
-            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
+            "timestamp": self._timestamp(record.created),
             "level": SEVERITY_MAP.get(record.levelno, record.levelname),
             "name": record.name,
             "message": record.getMessage(),
@@ -63,20 +203,23 @@ class JsonFormatter(logging.Formatter):
             "line": record.lineno,
             "function": record.funcName,
             "hostname": self.hostname,
+            # Thread and process info for threading/multiprocessing contexts
+            "thread": record.threadName,
+            "thread_id": record.thread,
+            "process": record.processName,
+            "process_id": record.process,
         }
         
-        # Add thread and process info in threading/multiprocessing contexts
-        log_data["thread"] = record.threadName
-        log_data["thread_id"] = record.thread
-        log_data["process"] = record.processName
-        log_data["process_id"] = record.process
-        
         # Add exception info if present
         if record.exc_info:
+            # Cache the traceback on the record, as logging.Formatter does, so
+            # other handlers of the same record reuse it
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
             log_data["exception"] = {
                 "type": record.exc_info[0].__name__,
                 "message": str(record.exc_info[1]),
-                "traceback": traceback.format_exception(*record.exc_info)
+                "traceback": record.exc_text
             }
         
         # Add any custom fields
@@ -86,16 +229,17 @@ class JsonFormatter(logging.Formatter):
             else:
                 log_data[field] = value
         
-        # Add any extra attributes from the record
-        for key, value in record.__dict__.items():
-            if key not in ["args", "asctime", "created", "exc_info", "exc_text",
-                          "filename", "funcName", "id", "levelname", "levelno",
-                          "lineno", "module", "msecs", "message", "msg", "name",
-                          "pathname", "process", "processName", "relativeCreated",
-                          "stack_info", "thread", "threadName"]:
-                log_data[key] = value
+        # Add any extra attributes from the record. Most records have none,
+        # which one subset check finds without looking at each attribute.
+        if not _RESERVED_RECORD_ATTRS.issuperset(record.__dict__):
+            log_data.update(
+                (key, value) for key, value in record.__dict__.items()
+                if key not in _RESERVED_RECORD_ATTRS
+            )
         
-        return json.dumps(log_data)
+        return _json_dumps(log_data)
+
+_EMPTY_CONTEXT = MappingProxyType({})
 
 class ContextualLogger(logging.Logger):
     """
@@ -103,21 +247,23 @@ class ContextualLogger(logging.Logger):
     """
     def __init__(self, name, level=logging.NOTSET):
         super().__init__(name, level)
-        self.context = {}
+        # Read-only and replaced rather than changed, so log calls on other
+        # threads always see a consistent snapshot
+        self.context = _EMPTY_CONTEXT
         self.correlation_id = None
     
     def with_context(self, **context):
         """
         Set context values to be included in all subsequent log messages.
         """
-        self.context.update(context)
+        self.context = MappingProxyType({**self.context, **context})
         return self
     
     def clear_context(self):
         """
         Clear all context values.
         """
-        self.context.clear()
+        self.context = _EMPTY_CONTEXT
         return self
     
     def with_correlation_id(self, correlation_id=None):
@@ -133,36 +279,184 @@ class ContextualLogger(logging.Logger):
         """
         Override _log to include context and correlation ID in log records.
         """
-        if extra is None:
-            extra = {}
+        # Without context, correlation ID or keyword fields, the caller's
+        # extra (or None) is passed through untouched
+        context = self.context
+        if context or self.correlation_id or kwargs:
+            # Include context in the log record, copying the caller's extra
+            # rather than adding to it
+            extra = {**extra, **context} if extra else dict(context)
+            
+            # Include correlation ID if set
+            if self.correlation_id:
+                extra["correlation_id"] = self.correlation_id
+            
+            # Add any keyword arguments as extra fields
+            if kwargs:
+                extra.update(kwargs)
         
-        # Include context in the log record
-        if self.context:
-            extra.update(self.context)
-        
-        # Include correlation ID if set
-        if self.correlation_id:
-            extra["correlation_id"] = self.correlation_id
-        
-        # Add any keyword arguments as extra fields
-        if kwargs:
-            extra.update(kwargs)
-        
-        super()._log(level, msg, args, exc_info, extra, stack_info, stacklevel)
+        # Skip this frame when finding the caller for the record
+        super()._log(level, msg, args, exc_info, extra, stack_info, stacklevel + 1)
     
     def trace(self, msg, *args, **kwargs):
         """
         Log a message with TRACE level.
         """
         if self.isEnabledFor(TRACE):
+            kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
             self._log(TRACE, msg, args, **kwargs)
 
+# Size of the write buffer of log files opened by the buffered file handlers
+_LOG_BUFFER_SIZE = 65_536
+
+class _BufferedFileMixin:
+    """
+    Mixin for file handlers that leave writes in the file buffer.
+    
+    The stock handlers flush after every record. These flush records at
+    WARNING or above immediately so problems reach the disk right away, and
+    otherwise start a timer on the first buffered record that flushes
+    everything written within flush_interval seconds in one go. The buffer
+    is also flushed when it fills, on rollover and on close.
+    """
+    flush_interval = 0.1
+    _flush_timer = None
+    
+    def _open(self):
+        """
+        Open the log file with a large write buffer.
+        """
+        # FileHandler.errors only exists from Python 3.9
+        return open(self.baseFilename, self.mode, buffering=_LOG_BUFFER_SIZE,
+                    encoding=self.encoding, errors=getattr(self, "errors", None))
+    
+    def _write(self, record, msg):
+        """
+        Write a formatted record, flushing right away if it is a warning or
+        worse and otherwise making sure a flush is scheduled.
+        
+        Called from emit(), with the handler lock held.
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        self.stream.write(msg)
+        
+        if record.levelno >= logging.WARNING:
+            self.stream.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self._timed_flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _timed_flush(self):
+        """
+        Flush the records buffered since the timer was started.
+        """
+        with self.lock:
+            self._flush_timer = None
+            if self.stream is not None:
+                try:
+                    self.stream.flush()
+                except (OSError, ValueError):
+                    pass
+    
+    def close(self):
+        """
+        Stop the flush timer, then flush and close the file.
+        """
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        super().close()
+
+class BufferedFileHandler(_BufferedFileMixin, logging.FileHandler):
+    """
+    File handler with buffered writes.
+    """
+    def emit(self, record):
+        """
+        Write a record to the file.
+        """
+        try:
+            self._write(record, self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class BufferedRotatingFileHandler(_BufferedFileMixin, logging.handlers.RotatingFileHandler):
+    """
+    Size-based rotating file handler with buffered writes.
+    
+    Unlike the stock handler, it formats each record once and tracks the
+    file size in a byte counter, since tell() on the text stream would
+    flush the buffer.
+    """
+    _bytes_written = 0
+    
+    def _open(self):
+        """
+        Open the log file and start counting from its current size.
+        """
+        stream = super()._open()
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def doRollover(self):
+        """
+        Roll the file over and reset the byte counter.
+        """
+        super().doRollover()
+        if self.stream is None:
+            self._bytes_written = 0
+    
+    def emit(self, record):
+        """
+        Write a record, rolling the file over first if it would get too big.
+        """
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            
+            size = len(msg) if msg.isascii() else len(msg.encode(self.encoding or "utf-8"))
+            # Never roll over anything other than regular files (bpo-45401)
+            if (self.maxBytes > 0
+                    and self._bytes_written + size >= self.maxBytes
+                    and os.path.isfile(self.baseFilename)):
+                self.doRollover()
+            
+            self._write(record, msg)
+            self._bytes_written += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class BufferedTimedRotatingFileHandler(_BufferedFileMixin, logging.handlers.TimedRotatingFileHandler):
+    """
+    Time-based rotating file handler with buffered writes.
+    """
+    def emit(self, record):
+        """
+        Write a record, rolling the file over first if it is due.
+        """
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            self._write(record, self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
 def create_rotating_log_handler(
     log_file: str,
     max_bytes: int = 10_485_760,  # 10MB
     backup_count: int = 5,
     encoding: str = "utf-8"
-) -> logging.handlers.RotatingFileHandler:
+) -> BufferedRotatingFileHandler:
     """
     Create a rotating file handler for log rotation based on size.
     
@@ -173,9 +467,9 @@ def create_rotating_log_handler(
         encoding: File encoding (default: utf-8)
     
     Returns:
-        RotatingFileHandler instance
+        BufferedRotatingFileHandler instance
     """
-    return logging.handlers.RotatingFileHandler(
+    return BufferedRotatingFileHandler(
         filename=log_file,
         maxBytes=max_bytes,
         backupCount=backup_count,
@@ -188,7 +482,7 @@ def create_timed_rotating_log_handler(
     interval: int = 1,
     backup_count: int = 7,
     encoding: str = "utf-8"
-) -> logging.handlers.TimedRotatingFileHandler:
+) -> BufferedTimedRotatingFileHandler:
     """
     Create a time-based rotating file handler for log rotation.
     
@@ -200,9 +494,9 @@ def create_timed_rotating_log_handler(
         encoding: File encoding (default: utf-8)
     
     Returns:
-        TimedRotatingFileHandler instance
+        BufferedTimedRotatingFileHandler instance
     """
-    return logging.handlers.TimedRotatingFileHandler(
+    return BufferedTimedRotatingFileHandler(
         filename=log_file,
         when=when,
         interval=interval,
@@ -222,50 +516,100 @@ class SensitiveDataFilter(logging.Filter):
             patterns: Dictionary mapping field names to regex patterns
         """
         super().__init__()
-        self.patterns = patterns or {
-            "password": r"password[\"']?\s*:\s*[\"']([^\"']+)[\"']",
-            "api_key": r"api_key[\"']?\s*:\s*[\"']([^\"']+)[\"']",
-            "auth": r"auth[\"']?\s*:\s*[\"']([^\"']+)[\"']",
-            "token": r"token[\"']?\s*:\s*[\"']([^\"']+)[\"']",
-            "authorization": r"Authorization[\"']?\s*:\s*[\"']([^\"']+)[\"']",
-            "secret": r"secret[\"']?\s*:\s*[\"']([^\"']+)[\"']",
-            "email": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
-            "phone": r"(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"
-        }
+        if patterns:
+            self.patterns = patterns
+            self.compiled_patterns = {k: re.compile(v) for k, v in patterns.items()}
+            checks = tuple((None, pattern) for pattern in self.compiled_patterns.values())
+        else:
+            self.patterns = dict(_DEFAULT_SENSITIVE_PATTERNS)
+            self.compiled_patterns = {
+                name: pattern
+                for name, (_, pattern) in zip(_DEFAULT_SENSITIVE_PATTERNS, _DEFAULT_COMPILED_PATTERNS)
+            }
+            checks = _DEFAULT_COMPILED_PATTERNS
         
-        import re
-        self.compiled_patterns = {k: re.compile(v) for k, v in self.patterns.items()}
+        # Log streams repeat the same short strings a lot, so remember recent
+        # results for those
+        self._mask_uncached = functools.partial(_mask_sensitive, patterns=checks)
+        self._mask_cached = functools.lru_cache(maxsize=4096)(self._mask_uncached)
+    
+    def _mask(self, text: str) -> str:
+        """
+        Mask sensitive data in a string, caching the result for short ones.
+        
+        Args:
+            text: String to mask
+        
+        Returns:
+            String with sensitive values masked
+        """
+        if len(text) <= _MASK_CACHE_MAX_LENGTH:
+            return self._mask_cached(text)
+        return self._mask_uncached(text)
     
     def filter(self, record):
         """
         Filter log records to mask sensitive data.
         """
-        if isinstance(record.msg, str):
-            for pattern_name, pattern in self.compiled_patterns.items():
-                # Replace with masked value (keeping first and last character if possible)
-                mask_length = 6  # Default mask length
-                record.msg = pattern.sub(
-                    lambda m: m.group(0).replace(
-                        m.group(1),
-                        m.group(1)[0] + "*" * mask_length + (m.group(1)[-1] if len(m.group(1)) > 1 else "")
-                    ),
-                    record.msg
-                )
+        # Mask the message merged with its arguments, where secrets are
+        # usually passed. Masking the format string alone could also turn a
+        # placeholder such as "%s" into an invalid one.
+        try:
+            message = record.getMessage()
+        except Exception:
+            # Leave broken format strings for the handler to report
+            pass
+        else:
+            record.msg = self._mask(message)
+            record.args = None
         
-        # Also check in any extra fields
-        for key in record.__dict__:
-            if isinstance(record.__dict__[key], str):
-                for pattern_name, pattern in self.compiled_patterns.items():
-                    record.__dict__[key] = pattern.sub(
-                        lambda m: m.group(0).replace(
-                            m.group(1), 
-                            m.group(1)[0] + "*" * 6 + (m.group(1)[-1] if len(m.group(1)) > 1 else "")
-                        ),
-                        record.__dict__[key]
-                    )
+        # Also check in any extra fields; standard record attributes such as
+        # paths and function names never hold sensitive data
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_RECORD_ATTRS and isinstance(value, str):
+                record.__dict__[key] = self._mask(value)
         
         return True
 
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that keeps exception info on queued records.
+    
+    The stock handler formats records with its own formatter and drops
+    exc_info, which would leave JsonFormatter on the listener's handlers
+    without the exception details.
+    """
+    def prepare(self, record):
+        """
+        Merge the message with its arguments on a copy of the record.
+        """
+        # Arguments are merged now, as they may change before the listener
+        # thread gets to the record
+        message = record.getMessage()
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        return record
+
+def _stop_queue_listener(logger: logging.Logger) -> None:
+    """
+    Stop the queue listener of a logger set up by setup_advanced_logger,
+    writing out any queued records.
+    
+    Args:
+        logger: Logger whose listener should be stopped
+    """
+    listener = getattr(logger, "_queue_listener", None)
+    if listener is not None:
+        logger._queue_listener = None
+        atexit.unregister(listener.stop)
+        listener.stop()
+        # Buffered file handlers would otherwise hold the last records until
+        # their flush timer fires
+        for handler in listener.handlers:
+            handler.flush()
+
 def setup_advanced_logger(
     name: str,
     log_dir: str = None,
@@ -277,7 +621,9 @@ def setup_advanced_logger(
     max_bytes: int = 10_485_760,  # 10MB
     backup_count: int = 5,
     filter_sensitive: bool = True,
-    context: Dict[str, Any] = None
+    context: Dict[str, Any] = None,
+    use_queue: bool = False,
+    batch: bool = True
 ) -> ContextualLogger:
     """
     Set up an advanced logger with file and console handlers.
@@ -294,6 +640,12 @@ def setup_advanced_logger(
         backup_count: Number of backup files for rotation (default: 5)
         filter_sensitive: Whether to filter sensitive data (default: True)
         context: Initial context values to include in logs (default: None)
+        use_queue: Whether to filter, format and write records on a background
+            thread, so logging calls only enqueue them. Forked worker processes
+            do not inherit the listener thread, so records they log through a
+            queued logger are never written (default: False)
+        batch: Whether to buffer log file writes, flushing them within 0.1
+            seconds, or at once for warnings and errors (default: True)
     
     Returns:
         Configured ContextualLogger
@@ -307,6 +659,7 @@ def setup_advanced_logger(
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(numeric_level)
+    _stop_queue_listener(logger)
     logger.handlers = []  # Clear existing handlers
     
     # Determine log file path if directory is provided but not specific file
@@ -325,10 +678,16 @@ def setup_advanced_logger(
     
     # Add file handler if specified
     if log_file:
-        if rotate_logs:
+        if rotate_logs and batch:
             file_handler = create_rotating_log_handler(
                 log_file, max_bytes=max_bytes, backup_count=backup_count
             )
+        elif rotate_logs:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+            )
+        elif batch:
+            file_handler = BufferedFileHandler(log_file)
         else:
             file_handler = logging.FileHandler(log_file)
         
@@ -349,19 +708,21 @@ def setup_advanced_logger(
         for handler in logger.handlers:
             handler.addFilter(sensitive_filter)
     
+    # Move the handlers behind a queue, so the calling thread only pays for
+    # putting the record on it
+    if use_queue and logger.handlers:
+        handlers = logger.handlers
+        log_queue = queue.SimpleQueue()
+        logger.handlers = [_RecordQueueHandler(log_queue)]
+        listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        logger._queue_listener = listener
+        atexit.register(listener.stop)
+    
     # Set initial context if provided
     if context and isinstance(logger, ContextualLogger):
         logger.with_context(**context)
     
     return logger
-
-# Make trace method available at module level
-def trace(self, msg, *args, **kwargs):
-    """
-    Log a message with TRACE level.
-    """
-    if self.isEnabledFor(TRACE):
-        self._log(TRACE, msg, args, **kwargs)
-
-# Add trace method to the Logger class
-logging.Logger.trace = trace
@@ -13,22 +13,401 @@ This module provides monitoring functionality to track:
 The metrics can be visualized in dashboards, used for alerting, or exported to monitoring systems.
 """
 
+import math
 import time
 import os
 import psutil
+import numpy as np
 import json
+import gzip
 import logging
 import threading
-import atexit
+import functools
+import heapq
+import itertools
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Callable, Union, Tuple
 from collections import defaultdict, deque
 import socket
+import weakref
 from pathlib import Path
 
+# Try to import orjson for faster metric exports, but don't fail if it's not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import tldextract to label requests by registered domain, but don't fail if it's not available
+try:
+    import tldextract
+    # Use the bundled public suffix snapshot; never fetch it over the network
+    _tld_extract = tldextract.TLDExtract(suffix_list_urls=())
+    TLDEXTRACT_AVAILABLE = True
+except ImportError:
+    TLDEXTRACT_AVAILABLE = False
+
 # Configure basic logger for this module
 logger = logging.getLogger(__name__)
 
+# Histogram bucket layout: log-spaced buckets ~2% wide covering [1e-6, 1e9];
+# bucket 0 collects zero, negative and smaller values, the last one overflow
+_HISTOGRAM_MIN_VALUE = 1e-6
+_HISTOGRAM_MAX_VALUE = 1e9
+_HISTOGRAM_GROWTH = 1.02
+_HISTOGRAM_LOG_SCALE = 1 / math.log(_HISTOGRAM_GROWTH)
+_HISTOGRAM_BUCKETS = int(math.log(_HISTOGRAM_MAX_VALUE / _HISTOGRAM_MIN_VALUE) * _HISTOGRAM_LOG_SCALE) + 2
+
+def _dumps_metrics(metrics: Dict[str, Any], indent: bool = False) -> bytes:
+    """
+    Serialize a metrics snapshot to JSON bytes, using orjson when available.
+    
+    Args:
+        metrics: Metrics dictionary from MetricsRegistry.get_metrics
+        indent: Whether to pretty-print with two-space indentation
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(metrics, default=str, option=option)
+    return json.dumps(metrics, indent=2 if indent else None, default=str).encode('utf-8')
+
+
+def _write_metrics(metrics: Dict[str, Any], file_path: Union[str, Path]) -> None:
+    """
+    Write a metrics snapshot as indented JSON.
+    
+    Args:
+        metrics: Metrics dictionary from MetricsRegistry.get_metrics
+        file_path: Destination file
+    """
+    with open(file_path, 'wb') as f:
+        f.write(_dumps_metrics(metrics, indent=True))
+
+
+# Compressed size at which a gzipped NDJSON metrics log is rotated
+_NDJSON_ROTATE_BYTES = 64 * 1024 * 1024
+
+
+class _NdjsonMetricsLog:
+    """
+    Append-only gzip-compressed NDJSON log holding one metrics snapshot per line.
+    """
+    def __init__(self, file_path: Union[str, Path]):
+        """
+        Open (or continue) the log.
+        
+        Args:
+            file_path: Path of the .gz log file
+        """
+        self.path = Path(file_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = gzip.open(self.path, 'ab')
+    
+    def write(self, metrics: Dict[str, Any]) -> None:
+        """
+        Append a snapshot and rotate the log once it grows past the limit.
+        
+        Writes after close() are ignored.
+        
+        Args:
+            metrics: Metrics dictionary from MetricsRegistry.get_metrics
+        """
+        line = _dumps_metrics(metrics) + b"\n"
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(line)
+            self._file.flush()
+            if self._file.fileobj.tell() >= _NDJSON_ROTATE_BYTES:
+                self._file.close()
+                self.path.rename(self._rotated_path())
+                self._file = gzip.open(self.path, 'ab')
+    
+    def _rotated_path(self) -> Path:
+        """
+        Pick an unused name for the rotated log.
+        
+        Returns:
+            Timestamped path, with a sequence suffix when several rotations
+            happen within the same second
+        """
+        base, _, extension = self.path.name.partition('.')
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        rotated = self.path.with_name(f"{base}_{timestamp}.{extension}")
+        sequence = 1
+        while rotated.exists():
+            rotated = self.path.with_name(f"{base}_{timestamp}_{sequence}.{extension}")
+            sequence += 1
+        return rotated
+    
+    def close(self) -> None:
+        """
+        Close the underlying file.
+        """
+        with self._lock:
+            self._file.close()
+
+
+@functools.lru_cache(maxsize=4096)
+def _host_label(netloc: str) -> str:
+    """
+    Collapse a URL network location to a low-cardinality host label.
+    
+    Args:
+        netloc: Network location, possibly with credentials and port
+        
+    Returns:
+        Registered domain when tldextract is available, otherwise the host
+        name without port and leading "www."
+    """
+    host = netloc.rpartition('@')[2].lower()
+    if host.startswith('['):
+        return host[:host.find(']') + 1]
+    host = host.partition(':')[0]
+    if TLDEXTRACT_AVAILABLE:
+        return _tld_extract(host).registered_domain or host
+    return host[4:] if host.startswith('www.') else host
+
+
+class _ScheduledJob:
+    """
+    Handle for a job registered with _PeriodicScheduler.
+    """
+    __slots__ = ("interval", "func", "cancelled")
+    
+    def __init__(self, interval: float, func: Callable[[], None]):
+        self.interval = interval
+        self.func = func
+        self.cancelled = False
+
+
+class _PeriodicScheduler:
+    """
+    Run periodic jobs from a single daemon thread.
+    
+    Jobs are kept in a heap ordered by their next run time, so metrics export
+    and system monitoring share one thread. The thread starts with the first
+    job and exits once no jobs remain.
+    """
+    def __init__(self):
+        self._heap = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = None
+    
+    def schedule(self, interval_seconds: float, func: Callable[[], None]) -> _ScheduledJob:
+        """
+        Run a function every interval_seconds, first after one interval.
+        
+        Args:
+            interval_seconds: Delay between the end of one run and the next
+            func: Function to call
+            
+        Returns:
+            Job handle for cancel()
+        """
+        job = _ScheduledJob(interval_seconds, func)
+        with self._condition:
+            heapq.heappush(self._heap, (time.monotonic() + interval_seconds, next(self._sequence), job))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="metrics-scheduler", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+        return job
+    
+    def cancel(self, job: _ScheduledJob, timeout: float = 5) -> None:
+        """
+        Cancel a job, waiting for a run that is already in progress.
+        
+        Args:
+            job: Handle returned from schedule()
+            timeout: Maximum seconds to wait for an in-progress run
+        """
+        with self._condition:
+            job.cancelled = True
+            self._condition.notify_all()
+            # A job cancelling itself must not wait for its own run to end
+            if threading.current_thread() is not self._thread:
+                self._condition.wait_for(lambda: self._running is not job, timeout)
+    
+    def _run(self) -> None:
+        """
+        Scheduler loop.
+        """
+        with self._condition:
+            while True:
+                while self._heap and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._thread = None
+                    return
+                
+                deadline, _, job = self._heap[0]
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                
+                heapq.heappop(self._heap)
+                self._running = job
+                self._condition.release()
+                try:
+                    job.func()
+                except Exception as e:
+                    logger.error(f"Error in scheduled metrics job: {e}")
+                finally:
+                    self._condition.acquire()
+                    self._running = None
+                    self._condition.notify_all()
+                
+                if not job.cancelled:
+                    heapq.heappush(self._heap, (time.monotonic() + job.interval, next(self._sequence), job))
+
+
+# Shared by every MetricsRegistry and SystemMonitor
+_scheduler = _PeriodicScheduler()
+
+
+class _TimerStats:
+    """
+    Running count/sum/min/max of a timer's durations.
+    """
+    __slots__ = ("count", "sum", "min", "max")
+    
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+    
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Return the aggregate in the exported timer format.
+        """
+        return {"count": self.count, "sum": self.sum, "min": self.min, "max": self.max}
+
+
+# Handle returned by start_timer: (metric key, perf_counter_ns() at start)
+TimerHandle = Tuple[str, int]
+
+# Sentinel for gauges that have not been set yet
+_MISSING = object()
+
+# HTTP status code classes used as request labels, keyed by status_code // 100
+_STATUS_CLASSES = {1: "1xx", 2: "2xx", 3: "3xx", 4: "4xx", 5: "5xx"}
+
+# Maximum number of memoized (name, labels) -> key entries before the cache is reset
+_KEY_CACHE_SIZE = 10_000
+
+
+class _StreamingHistogram:
+    """
+    Fixed-memory histogram with log-spaced buckets.
+    
+    Count, sum, min and max are exact; percentiles are interpolated inside
+    their bucket, so they are accurate to within one bucket width.
+    """
+    __slots__ = ("buckets", "count", "sum", "min", "max")
+    
+    def __init__(self):
+        self.buckets = [0] * _HISTOGRAM_BUCKETS
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+    
+    def record(self, value: float) -> None:
+        """
+        Add a value to the histogram.
+        
+        Args:
+            value: Value to record
+        """
+        if value >= _HISTOGRAM_MAX_VALUE:
+            # Also catches inf, which math.log cannot bucket
+            index = _HISTOGRAM_BUCKETS - 1
+        elif value >= _HISTOGRAM_MIN_VALUE:
+            index = min(int(math.log(value / _HISTOGRAM_MIN_VALUE) * _HISTOGRAM_LOG_SCALE) + 1,
+                        _HISTOGRAM_BUCKETS - 1)
+        else:
+            index = 0
+        self.buckets[index] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def copy(self) -> "_StreamingHistogram":
+        """
+        Return a snapshot that can be read without holding the registry lock.
+        """
+        snapshot = _StreamingHistogram.__new__(_StreamingHistogram)
+        snapshot.buckets = self.buckets[:]
+        snapshot.count = self.count
+        snapshot.sum = self.sum
+        snapshot.min = self.min
+        snapshot.max = self.max
+        return snapshot
+    
+    def _value_at(self, cumulative: np.ndarray, rank: int) -> float:
+        """
+        Estimate the value of the sample at a 0-based rank.
+        
+        Args:
+            cumulative: Cumulative bucket counts
+            rank: Rank of the sample in sorted order
+            
+        Returns:
+            Interpolated value, clamped to the observed min/max
+        """
+        index = int(np.searchsorted(cumulative, rank, side='right'))
+        if index == 0:
+            # Underflow bucket is dominated by zeros (e.g. empty scrapes)
+            value = 0.0
+        elif index == _HISTOGRAM_BUCKETS - 1:
+            return self.max
+        else:
+            in_bucket = self.buckets[index]
+            fraction = (rank - (int(cumulative[index]) - in_bucket) + 0.5) / in_bucket
+            lower = _HISTOGRAM_MIN_VALUE * _HISTOGRAM_GROWTH ** (index - 1)
+            value = lower + lower * (_HISTOGRAM_GROWTH - 1) * fraction
+        return min(max(value, self.min), self.max)
+    
+    def stats(self) -> Dict[str, float]:
+        """
+        Summarise the histogram.
+        
+        Returns:
+            Dictionary with count, sum, min, max, avg, median, p95 and p99
+        """
+        length = self.count
+        cumulative = np.cumsum(self.buckets)
+        mid = length // 2
+        median = self._value_at(cumulative, mid)
+        if not length % 2:
+            median = (self._value_at(cumulative, mid - 1) + median) / 2
+        return {
+            "count": length,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "avg": self.sum / length,
+            "median": median,
+            "p95": self._value_at(cumulative, int(length * 0.95)) if length > 20 else self.max,
+            "p99": self._value_at(cumulative, int(length * 0.99)) if length > 100 else self.max
+        }
+
+
 class MetricsRegistry:
     """
     Registry for collecting and tracking metrics.
@@ -50,19 +429,46 @@ class MetricsRegistry:
         self.host = socket.gethostname()
         self._counters = defaultdict(int)
         self._gauges = {}
-        self._histograms = defaultdict(list)
+        self._histograms = {}
         self._timers = {}
-        self._timer_starts = {}
+        self._key_cache = {}
+        # Histogram key -> (sample count, stats) from the last get_metrics call
+        self._histogram_stats_cache = {}
+        # Guards counter read-modify-write; worker threads record requests concurrently
+        self._lock = threading.Lock()
         self._last_export = datetime.now()
-        self._metrics_history = defaultdict(lambda: deque(maxlen=1000))  # Keep last 1000 values for each metric
+        # Keep last 1000 (epoch seconds, value) pairs for each metric
+        self._metrics_history = defaultdict(lambda: deque(maxlen=1000))
         
         # Initialize periodic export if enabled
         self._export_interval = None
-        self._export_thread = None
-        self._exit_event = threading.Event()
+        self._export_job = None
+        self._ndjson_log = None
         
-        # Register shutdown handler
-        atexit.register(self.shutdown)
+        # Shut down at interpreter exit without keeping the registry alive until then
+        self._finalizer = weakref.finalize(self, MetricsRegistry._shutdown_ref, weakref.ref(self))
+    
+    def create_counter(self, name: str, labels: Dict[str, str] = None) -> None:
+        """
+        Register a counter so it is reported as 0 before its first increment.
+        
+        Args:
+            name: Name of the metric
+            labels: Additional labels to apply to the metric
+        """
+        key = self._make_key(name, labels)
+        with self._lock:
+            self._counters.setdefault(key, 0)
+    
+    def create_gauge(self, name: str, labels: Dict[str, str] = None) -> None:
+        """
+        Register a gauge so it is reported as 0 before it is first set.
+        
+        Args:
+            name: Name of the metric
+            labels: Additional labels to apply to the metric
+        """
+        self._gauges.setdefault(self._make_key(name, labels), 0)
     
     def inc_counter(self, name: str, value: int = 1, labels: Dict[str, str] = None) -> None:
         """
@@ -74,9 +480,12 @@ class MetricsRegistry:
             labels: Additional labels to apply to the metric
         """
         key = self._make_key(name, labels)
-        self._counters[key] += value
-        self._metrics_history[f"counter:{key}"].append((datetime.now(), self._counters[key]))
-        logger.debug(f"Counter {key} incremented by {value} to {self._counters[key]}")
+        with self._lock:
+            self._counters[key] += value
+            current = self._counters[key]
+        self._metrics_history[f"counter:{key}"].append((time.time(), current))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Counter {key} incremented by {value} to {current}")
     
     def dec_counter(self, name: str, value: int = 1, labels: Dict[str, str] = None) -> None:
         """
@@ -88,9 +497,12 @@ class MetricsRegistry:
             labels: Additional labels to apply to the metric
         """
         key = self._make_key(name, labels)
-        self._counters[key] -= value
-        self._metrics_history[f"counter:{key}"].append((datetime.now(), self._counters[key]))
-        logger.debug(f"Counter {key} decremented by {value} to {self._counters[key]}")
+        with self._lock:
+            self._counters[key] -= value
+            current = self._counters[key]
+        self._metrics_history[f"counter:{key}"].append((time.time(), current))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Counter {key} decremented by {value} to {current}")
     
     def set_gauge(self, name: str, value: float, labels: Dict[str, str] = None) -> None:
         """
@@ -102,77 +514,111 @@ class MetricsRegistry:
             labels: Additional labels to apply to the metric
         """
         key = self._make_key(name, labels)
+        # History records changes only; slow-moving gauges are re-set every tick
+        if self._gauges.get(key, _MISSING) == value:
+            return
         self._gauges[key] = value
-        self._metrics_history[f"gauge:{key}"].append((datetime.now(), value))
-        logger.debug(f"Gauge {key} set to {value}")
+        self._metrics_history[f"gauge:{key}"].append((time.time(), value))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Gauge {key} set to {value}")
+    
+    def set_gauges(self, values: Dict[str, float], labels: Dict[str, str] = None) -> None:
+        """
+        Set several gauge metrics sharing the same labels in one update.
+        
+        Args:
+            values: Mapping of metric name to value
+            labels: Additional labels to apply to every metric
+        """
+        gauges = self._gauges
+        updates = {}
+        for name, value in values.items():
+            key = self._make_key(name, labels)
+            if gauges.get(key, _MISSING) != value:
+                updates[key] = value
+        if not updates:
+            return
+        gauges.update(updates)
+        now = time.time()
+        for key, value in updates.items():
+            self._metrics_history[f"gauge:{key}"].append((now, value))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Gauges set: {updates}")
     
     def record_histogram(self, name: str, value: float, labels: Dict[str, str] = None) -> None:
         """
         Record a value in a histogram metric.
         
+        NaN values are dropped, since they have no place in the distribution
+        and would turn the sum and average into NaN.
+        
         Args:
             name: Name of the metric
             value: Value to record
             labels: Additional labels to apply to the metric
         """
+        if value != value:
+            logger.debug(f"Dropped NaN value for histogram {name}")
+            return
         key = self._make_key(name, labels)
-        self._histograms[key].append(value)
-        self._metrics_history[f"histogram:{key}"].append((datetime.now(), value))
-        logger.debug(f"Histogram {key} recorded value {value}")
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = _StreamingHistogram()
+            hist.record(value)
+        self._metrics_history[f"histogram:{key}"].append((time.time(), value))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Histogram {key} recorded value {value}")
     
-    def start_timer(self, name: str, labels: Dict[str, str] = None) -> str:
+    def start_timer(self, name: str, labels: Dict[str, str] = None) -> TimerHandle:
         """
         Start a timer for measuring operation duration.
         
+        The start time lives only in the returned handle, so each handle
+        should be passed to stop_timer once.
+        
         Args:
             name: Name of the timer
             labels: Additional labels to apply to the metric
             
         Returns:
-            Timer ID for stopping the timer
+            Timer handle for stopping the timer
         """
-        key = self._make_key(name, labels)
-        timer_id = f"{key}:{id(threading.current_thread())}:{time.time_ns()}"
-        self._timer_starts[timer_id] = time.time()
-        logger.debug(f"Timer {timer_id} started")
-        return timer_id
+        return (self._make_key(name, labels), time.perf_counter_ns())
     
-    def stop_timer(self, timer_id: str) -> float:
+    def stop_timer(self, timer_id: TimerHandle) -> float:
         """
         Stop a timer and record the duration.
         
         Args:
-            timer_id: Timer ID returned from start_timer
+            timer_id: Timer handle returned from start_timer
             
         Returns:
             Duration in seconds
         """
-        if timer_id not in self._timer_starts:
-            logger.warning(f"Timer {timer_id} not found")
+        try:
+            base_key, start_ns = timer_id
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid timer handle {timer_id!r}")
             return 0.0
         
-        start_time = self._timer_starts.pop(timer_id)
-        duration = time.time() - start_time
-        
-        # Extract the base key from the timer_id
-        base_key = timer_id.split(':', 1)[0]
+        duration = (time.perf_counter_ns() - start_ns) * 1e-9
         
         # Update timer stats
-        if base_key not in self._timers:
-            self._timers[base_key] = {
-                "count": 0,
-                "sum": 0.0,
-                "min": float('inf'),
-                "max": 0.0
-            }
-        
-        self._timers[base_key]["count"] += 1
-        self._timers[base_key]["sum"] += duration
-        self._timers[base_key]["min"] = min(self._timers[base_key]["min"], duration)
-        self._timers[base_key]["max"] = max(self._timers[base_key]["max"], duration)
-        
-        self._metrics_history[f"timer:{base_key}"].append((datetime.now(), duration))
-        logger.debug(f"Timer {timer_id} stopped. Duration: {duration:.6f}s")
+        with self._lock:
+            stats = self._timers.get(base_key)
+            if stats is None:
+                stats = self._timers[base_key] = _TimerStats()
+            stats.count += 1
+            stats.sum += duration
+            if duration < stats.min:
+                stats.min = duration
+            if duration > stats.max:
+                stats.max = duration
+        
+        self._metrics_history[f"timer:{base_key}"].append((time.time(), duration))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Timer {base_key} stopped. Duration: {duration:.6f}s")
         
         return duration
     
@@ -190,9 +636,17 @@ class MetricsRegistry:
         if not labels:
             return name
         
-        # Sort labels to ensure consistent keys
-        label_str = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-        return f"{name}{{{label_str}}}"
+        # Label dicts repeat on hot paths; insertion order only affects the cache slot
+        cache_key = (name, tuple(labels.items()))
+        key = self._key_cache.get(cache_key)
+        if key is None:
+            # Sort labels to ensure consistent keys
+            label_str = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+            key = f"{name}{{{label_str}}}"
+            if len(self._key_cache) >= _KEY_CACHE_SIZE:
+                self._key_cache.clear()
+            self._key_cache[cache_key] = key
+        return key
     
     def get_metrics(self) -> Dict[str, Any]:
         """
@@ -201,43 +655,42 @@ class MetricsRegistry:
         Returns:
             Dictionary of all metrics
         """
-        # Calculate histogram stats
-        histogram_stats = {}
-        for name, values in self._histograms.items():
-            if values:
-                values.sort()
-                length = len(values)
-                histogram_stats[name] = {
-                    "count": length,
-                    "sum": sum(values),
-                    "min": values[0],
-                    "max": values[-1],
-                    "avg": sum(values) / length,
-                    "median": values[length // 2] if length % 2 else (values[length // 2 - 1] + values[length // 2]) / 2,
-                    "p95": values[int(length * 0.95)] if length > 20 else values[-1],
-                    "p99": values[int(length * 0.99)] if length > 100 else values[-1]
-                }
+        stats_cache = self._histogram_stats_cache
+        with self._lock:
+            counters = dict(self._counters)
+            # Only histograms that received samples since the last call are summarised again
+            changed = [
+                (name, hist.copy()) for name, hist in self._histograms.items()
+                if stats_cache.get(name, (None,))[0] != hist.count
+            ]
+            names = list(self._histograms)
+            timers = {name: stats.as_dict() for name, stats in self._timers.items()}
+        
+        for name, hist in changed:
+            stats_cache[name] = (hist.count, hist.stats())
+        histogram_stats = {name: dict(stats_cache[name][1]) for name in names}
         
         # Build complete metrics report
         return {
             "timestamp": datetime.now().isoformat(),
             "app": self.app_name,
             "host": self.host,
-            "counters": dict(self._counters),
+            "counters": counters,
             "gauges": dict(self._gauges),
             "histograms": histogram_stats,
-            "timers": dict(self._timers)
+            "timers": timers
         }
     
     def reset(self) -> None:
         """
         Reset all metrics.
         """
-        self._counters = defaultdict(int)
+        with self._lock:
+            self._counters = defaultdict(int)
+            self._histograms = {}
+            self._histogram_stats_cache = {}
+            self._timers = {}
         self._gauges = {}
-        self._histograms = defaultdict(list)
-        self._timers = {}
-        self._timer_starts = {}
         logger.info("All metrics have been reset")
     
     def export_metrics(self, file_path: Optional[str] = None) -> Dict[str, Any]:
@@ -257,8 +710,7 @@ class MetricsRegistry:
             os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
             
             # Write metrics to file
-            with open(file_path, 'w') as f:
-                json.dump(metrics, f, indent=2)
+            _write_metrics(metrics, file_path)
             
             logger.info(f"Metrics exported to {file_path}")
         
@@ -274,58 +726,78 @@ class MetricsRegistry:
         
         Args:
             interval_seconds: Export interval in seconds
-            file_path: Path to export metrics to (optional)
+            file_path: Path to export metrics to (optional). A path ending in
+                ".gz" appends gzipped NDJSON snapshots to that one file;
+                otherwise each export writes a timestamped JSON file.
             callback: Function to call with metrics (optional)
         """
-        if self._export_thread is not None:
+        if self._export_job is not None:
             logger.warning("Periodic export already running")
             return
         
         self._export_interval = interval_seconds
-        self._exit_event.clear()
+        ndjson_log = _NdjsonMetricsLog(file_path) if file_path and file_path.endswith('.gz') else None
+        self._ndjson_log = ndjson_log
         
-        def export_loop():
-            while not self._exit_event.wait(self._export_interval):
-                metrics = self.get_metrics()
-                
-                # Export to file if specified
-                if file_path:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    path = Path(file_path)
-                    export_path = path.parent / f"{path.stem}_{timestamp}{path.suffix}"
-                    
-                    with open(export_path, 'w') as f:
-                        json.dump(metrics, f, indent=2)
+        def export_once():
+            metrics = self.get_metrics()
+            
+            # Export to file if specified
+            if ndjson_log:
+                ndjson_log.write(metrics)
+            elif file_path:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                path = Path(file_path)
+                export_path = path.parent / f"{path.stem}_{timestamp}{path.suffix}"
                 
-                # Call callback if specified
-                if callback:
-                    try:
-                        callback(metrics)
-                    except Exception as e:
-                        logger.error(f"Error in metrics callback: {e}")
-        
-        self._export_thread = threading.Thread(target=export_loop, daemon=True)
-        self._export_thread.start()
+                _write_metrics(metrics, export_path)
+            
+            # Call callback if specified
+            if callback:
+                try:
+                    callback(metrics)
+                except Exception as e:
+                    logger.error(f"Error in metrics callback: {e}")
+        
+        self._export_job = _scheduler.schedule(interval_seconds, export_once)
         logger.info(f"Started periodic metrics export every {interval_seconds} seconds")
     
     def stop_periodic_export(self) -> None:
         """
         Stop periodic export of metrics.
         """
-        if self._export_thread is None:
+        if self._export_job is None:
             return
         
-        self._exit_event.set()
-        self._export_thread.join(timeout=5)
-        self._export_thread = None
+        _scheduler.cancel(self._export_job)
+        self._export_job = None
+        if self._ndjson_log:
+            self._ndjson_log.close()
+            self._ndjson_log = None
         logger.info("Stopped periodic metrics export")
     
+    @staticmethod
+    def _shutdown_ref(ref: "weakref.ref[MetricsRegistry]") -> None:
+        """
+        Finalizer callback; shuts the registry down if it is still alive.
+        
+        Args:
+            ref: Weak reference to the registry
+        """
+        registry = ref()
+        if registry is not None:
+            registry.shutdown()
+    
     def shutdown(self) -> None:
         """
         Perform cleanup operations on shutdown.
         """
         self.stop_periodic_export()
         
+        # Nothing was recorded, so there is nothing to export
+        if not (self._counters or self._gauges or self._histograms or self._timers):
+            return
+        
         # Export final metrics if needed
         if (datetime.now() - self._last_export).total_seconds() > 10:
             try:
@@ -346,8 +818,9 @@ class SystemMonitor:
         """
         self.metrics = metrics_registry
         self.process = psutil.Process(os.getpid())
-        self.monitor_thread = None
-        self.stop_event = threading.Event()
+        # First non-blocking cpu_percent call only sets the baseline
+        self.process.cpu_percent(interval=None)
+        self.monitor_job = None
     
     def record_current_usage(self) -> Dict[str, float]:
         """
@@ -356,19 +829,16 @@ class SystemMonitor:
         Returns:
             Dictionary with current usage metrics
         """
-        # CPU usage (percent)
+        # CPU usage (percent) since the previous call; non-blocking, primed in __init__
         try:
-            cpu_percent = self.process.cpu_percent(interval=0.1)
-            self.metrics.set_gauge("system.cpu.percent", cpu_percent)
+            cpu_percent = self.process.cpu_percent(interval=None)
         except Exception as e:
             logger.error(f"Error getting CPU usage: {e}")
             cpu_percent = 0
         
         # Memory usage (MB)
         try:
-            memory_info = self.process.memory_info()
-            memory_mb = memory_info.rss / (1024 * 1024)
-            self.metrics.set_gauge("system.memory.rss_mb", memory_mb)
+            memory_mb = self.process.memory_info().rss / (1024 * 1024)
         except Exception as e:
             logger.error(f"Error getting memory usage: {e}")
             memory_mb = 0
@@ -376,15 +846,13 @@ class SystemMonitor:
         # Open files count
         try:
             open_files = len(self.process.open_files())
-            self.metrics.set_gauge("system.open_files", open_files)
         except Exception as e:
             logger.error(f"Error getting open files count: {e}")
             open_files = 0
         
         # Thread count
         try:
-            thread_count = len(self.process.threads())
-            self.metrics.set_gauge("system.thread_count", thread_count)
+            thread_count = self.process.num_threads()
         except Exception as e:
             logger.error(f"Error getting thread count: {e}")
             thread_count = 0
@@ -392,11 +860,18 @@ class SystemMonitor:
         # System-wide metrics
         try:
             disk_usage = psutil.disk_usage('/').percent
-            self.metrics.set_gauge("system.disk.percent", disk_usage)
         except Exception as e:
             logger.error(f"Error getting disk usage: {e}")
             disk_usage = 0
         
+        self.metrics.set_gauges({
+            "system.cpu.percent": cpu_percent,
+            "system.memory.rss_mb": memory_mb,
+            "system.open_files": open_files,
+            "system.thread_count": thread_count,
+            "system.disk.percent": disk_usage
+        })
+        
         return {
             "cpu_percent": cpu_percent,
             "memory_mb": memory_mb,
@@ -412,33 +887,28 @@ class SystemMonitor:
         Args:
             interval_seconds: Interval between measurements in seconds
         """
-        if self.monitor_thread is not None:
+        if self.monitor_job is not None:
             logger.warning("Monitoring already started")
             return
         
-        self.stop_event.clear()
-        
-        def monitor_loop():
-            while not self.stop_event.wait(interval_seconds):
-                try:
-                    self.record_current_usage()
-                except Exception as e:
-                    logger.error(f"Error in system monitoring: {e}")
+        def monitor_once():
+            try:
+                self.record_current_usage()
+            except Exception as e:
+                logger.error(f"Error in system monitoring: {e}")
         
-        self.monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
-        self.monitor_thread.start()
+        self.monitor_job = _scheduler.schedule(interval_seconds, monitor_once)
         logger.info(f"Started system monitoring every {interval_seconds} seconds")
     
     def stop_monitoring(self) -> None:
         """
         Stop periodic monitoring of system resources.
         """
-        if self.monitor_thread is None:
+        if self.monitor_job is None:
             return
         
-        self.stop_event.set()
-        self.monitor_thread.join(timeout=5)
-        self.monitor_thread = None
+        _scheduler.cancel(self.monitor_job)
+        self.monitor_job = None
         logger.info("Stopped system monitoring")
 
 
@@ -455,7 +925,7 @@ class ScraperMetrics:
         """
         self.metrics = metrics_registry
     
-    def record_scrape_start(self, scraper_name: str, query: str = None) -> str:
+    def record_scrape_start(self, scraper_name: str, query: str = None) -> TimerHandle:
         """
         Record the start of a scraping operation.
         
@@ -464,7 +934,7 @@ class ScraperMetrics:
             query: Search query being executed
             
         Returns:
-            Timer ID for stopping the timer
+            Timer handle for stopping the timer
         """
         labels = {"scraper": scraper_name}
         if query:
@@ -474,13 +944,13 @@ class ScraperMetrics:
         timer_id = self.metrics.start_timer("scraper.duration", labels=labels)
         return timer_id
     
-    def record_scrape_success(self, scraper_name: str, timer_id: str, items_found: int) -> None:
+    def record_scrape_success(self, scraper_name: str, timer_id: TimerHandle, items_found: int) -> None:
         """
         Record a successful scraping operation.
         
         Args:
             scraper_name: Name of the scraper
-            timer_id: Timer ID from record_scrape_start
+            timer_id: Timer handle from record_scrape_start
             items_found: Number of items found
         """
         labels = {"scraper": scraper_name, "result": "success"}
@@ -494,13 +964,13 @@ class ScraperMetrics:
             time_per_item = duration / items_found
             self.metrics.record_histogram("scraper.time_per_item", time_per_item, labels=labels)
     
-    def record_scrape_failure(self, scraper_name: str, timer_id: str, error: str) -> None:
+    def record_scrape_failure(self, scraper_name: str, timer_id: TimerHandle, error: str) -> None:
         """
         Record a failed scraping operation.
         
         Args:
             scraper_name: Name of the scraper
-            timer_id: Timer ID from record_scrape_start
+            timer_id: Timer handle from record_scrape_start
             error: Error message
         """
         labels = {"scraper": scraper_name, "result": "failure", "error": error}
@@ -516,15 +986,18 @@ class ScraperMetrics:
             scraper_name: Name of the scraper
             url: URL of the request
             success: Whether the request was successful
-            status_code: HTTP status code
+            status_code: HTTP status code, labelled by class (e.g. "4xx")
         """
+        # Bounded splits stop before the path and query, which can be long
+        netloc = url.split('/', 3)[2] if '://' in url else url.split('/', 1)[0]
         labels = {
             "scraper": scraper_name,
-            "host": url.split('/')[2] if '://' in url else url.split('/')[0]
+            "host": _host_label(netloc)
         }
         
+        # Status classes keep one counter per class instead of per code
         if status_code:
-            labels["status_code"] = str(status_code)
+            labels["status_class"] = _STATUS_CLASSES.get(status_code // 100, "other")
         
         self.metrics.inc_counter("scraper.requests", labels=labels)
         